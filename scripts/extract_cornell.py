@@ -6,26 +6,152 @@ Extracts Common Data Set information from Cornell PDF files.
 Handles multiple format variations across different years.
 """
 
+import functools
+import hashlib
 import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
+# PyMuPDF extracts plain page text an order of magnitude faster than
+# pdfplumber; this script only needs raw text, so prefer it when installed.
+try:
+    import fitz
+except ImportError:
+    fitz = None
+
 try:
     import pdfplumber
 except ImportError:
-    print("Error: pdfplumber is required. Install with: pip install pdfplumber")
+    pdfplumber = None
+
+# orjson serializes in C; the stdlib json module is a fine fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if fitz is None and pdfplumber is None:
+    print("Error: PyMuPDF or pdfplumber is required. Install with: pip install pymupdf")
     sys.exit(1)
 
 
+class _RE:
+    """Precompiled patterns, hoisted so the per-line loops skip re's cache lookup."""
+    # Number cleanup in full_text
+    space_before_comma = re.compile(r'(\d)\s+,')
+    split_number = re.compile(r'(?<!\d)(\d{1,2}) (\d,\d{3})')
+    # Number extraction
+    int_run = re.compile(r'(\d+)')
+    num_run = re.compile(r'(\d[\d,]*)')
+    num_run_bounded = re.compile(r'\b(\d[\d,]*)\b')
+    decimal_num = re.compile(r'([\d,]+\.?\d*)')
+    # Test scores
+    four_digit = re.compile(r'\b(\d{4})\b')
+    three_digit = re.compile(r'\b(\d{3})\b')
+    two_digit = re.compile(r'\b(\d{2})\b')
+    # Costs and financial aid
+    dollar_amount = re.compile(r'\$?\s*([\d,]+)')
+    dollar_strict = re.compile(r'\$\s*([\d,]+)')
+    percent = re.compile(r'(\d+\.?\d*)\s*%?')
+    percent_strict = re.compile(r'(\d+\.?\d*)\s*%')
+
+
+# Demographics by race (Section B2) - keyword -> output field
+_RACE_KEYWORDS = {
+    'nonresident alien': 'international',
+    'international': 'international',
+    'hispanic': 'hispanicLatino',
+    'latino': 'hispanicLatino',
+    'black': 'blackAfricanAmerican',
+    'african american': 'blackAfricanAmerican',
+    'white': 'white',
+    'asian': 'asian',
+    'american indian': 'americanIndianAlaskaNative',
+    'alaska native': 'americanIndianAlaskaNative',
+    'native hawaiian': 'nativeHawaiianPacificIslander',
+    'pacific islander': 'nativeHawaiianPacificIslander',
+    'two or more': 'twoOrMoreRaces',
+    'multiracial': 'twoOrMoreRaces',
+    'race/ethnicity unknown': 'unknown',
+    'unknown': 'unknown',
+}
+
+# Single multi-keyword matcher for the B2 table: one scan of the line instead
+# of 16 separate substring tests. Longest alternatives first so specific
+# keywords ("race/ethnicity unknown") win over their substrings ("unknown").
+_RACE_RE = re.compile('|'.join(
+    re.escape(k) for k in sorted(_RACE_KEYWORDS, key=len, reverse=True)
+))
+
+# Master trigger alternation: one compiled scan per line replaces the dozens
+# of substring tests the fused loop used to run. Each named group is a tag;
+# the loop collects the tags present on a line and dispatches on membership.
+# Alternatives that can start at the same offset are ordered longest-first so
+# the specific tag wins (e.g. 'sat composite' before 'sat'). The `(?<!wo)`
+# lookbehinds keep "women who ..." rows from also tagging the men's rows.
+_TRIGGER_RE = re.compile(
+    r'(?P<f2_applied>students who applied in fall)'
+    r'|(?P<f2_admitted>students admitted in fall)'
+    r'|(?P<f2_enrolled>students enrolled in fall)'
+    r'|(?P<t_applied>degree-seeking(?=[^\n]*who applied))'
+    r'|(?P<t_admitted>degree-seeking(?=[^\n]*who were admitted))'
+    r'|(?P<t_enrolled>degree-seeking(?=[^\n]*enrolled))'
+    r'|(?P<degsk>degree-seeking)'
+    r'|(?P<firsty>first-time|first-year|freshman)'
+    r'|(?P<w_applied>women who applied)'
+    r'|(?P<m_applied>(?<!wo)men who applied)'
+    r'|(?P<w_admitted>women who were admitted)'
+    r'|(?P<m_admitted>(?<!wo)men who were admitted)'
+    r'|(?P<w_enrolled>women who enrolled)'
+    r'|(?P<m_enrolled>(?<!wo)men who enrolled)'
+    r'|(?P<women>women)'
+    r'|(?P<ed>early decision)'
+    r'|(?P<sat_comp>sat composite)'
+    r'|(?P<evid>evidence-based|ebrw|evidence)'
+    r'|(?P<crit_read>critical reading)'
+    r'|(?P<reading>reading)'
+    r'|(?P<writing>writing)'
+    r'|(?P<math>math)'
+    r'|(?P<sat_w>sat)'
+    r'|(?P<act_comp>act composite)'
+    r'|(?P<composite>composite)'
+    r'|(?P<act_w>act)'
+    r'|(?P<ug_total>total (?:of all )?undergraduate)'
+    r'|(?P<g_total>total (?:of all )?graduate)'
+    r'|(?P<total_w>total)'
+    r'|(?P<undergrad_w>undergraduate)'
+    r'|(?P<tuition>tuition)'
+    r'|(?P<req_fee>required[^\n]{0,40}?fee)'
+    r'|(?P<room_board>room[^\n]{0,40}?board)'
+    r'|(?P<food_housing>food and housing)'
+    r'|(?P<avg_grant>average[^\n]{0,80}?need-based[^\n]{0,80}?grant)'
+    r'|(?P<h2k>h2(?=[^\n]*k))'
+    r'|(?P<nfm>need fully met)'
+    r'|(?P<fm>fully met)'
+    r'|(?P<percent_w>percent)'
+    r'|(?P<recv>receiving)'
+    r'|(?P<needb>need-based)'
+    r'|(?P<ft>full-time)'
+    r'|(?P<pt>part-time)'
+)
+
+
+# Translate table that drops commas and whitespace in one C-level pass
+_SEPARATOR_STRIP = str.maketrans('', '', ', \t\r\n\x0b\x0c')
+
+
 def extract_number(text):
     """Extract a number from text, handling commas and spaces in numbers."""
     if not text:
         return 0
-    # Remove spaces within numbers (handles "35 ,672" -> "35672")
-    cleaned = re.sub(r'(\d)\s+(\d)', r'\1\2', str(text))
-    cleaned = re.sub(r'[,\s]', '', cleaned)
-    match = re.search(r'(\d+)', cleaned)
+    # Stripping separators handles "35 ,672", "3 5,672" and "71,164" alike;
+    # the single search then grabs the leading digit run (so "$48,010" and
+    # "33,674.0" still parse correctly).
+    digits = str(text).translate(_SEPARATOR_STRIP)
+    match = _RE.int_run.search(digits)
     if match:
         return int(match.group(1))
     return 0
@@ -42,14 +168,63 @@ def extract_float(text):
         return 0.0
 
 
+def _first_in_range(line, lo, hi, finditer=_RE.num_run.finditer):
+    """Return the first number on the line strictly between lo and hi, or 0.
+
+    finditer lets the regex engine stop at the first qualifying number
+    instead of materializing every number on the line first.
+    """
+    for m in finditer(line):
+        n = extract_number(m.group(1))
+        if lo < n < hi:
+            return n
+    return 0
+
+
+def _cache_on_disk(func):
+    """Cache per-PDF extraction results keyed by the PDF's content hash.
+
+    Opt-in with PDF_CACHE=1. The key is the PDF bytes only, so a warm
+    cache serves stale results after any change to the extraction logic;
+    delete .cache/extract_cornell (or rerun without PDF_CACHE) after
+    editing this script.
+    """
+    cache_dir = Path(".cache/extract_cornell")
+
+    @functools.wraps(func)
+    def wrapper(pdf_path, year_label):
+        if not os.environ.get("PDF_CACHE"):
+            return func(pdf_path, year_label)
+        digest = hashlib.blake2b(Path(pdf_path).read_bytes(), digest_size=16).hexdigest()
+        cache_file = cache_dir / f"{digest}.json"
+        if cache_file.exists():
+            print(f"Using cached extraction for {pdf_path} ({year_label})")
+            with open(cache_file) as f:
+                return json.load(f)
+        data = func(pdf_path, year_label)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "w") as f:
+            json.dump(data, f)
+        return data
+
+    return wrapper
+
+
+@_cache_on_disk
 def extract_cornell_year(pdf_path, year_label):
     """Extract all data from a single Cornell CDS PDF."""
     print(f"Processing {pdf_path} for year {year_label}")
 
-    pdf = pdfplumber.open(pdf_path)
-
-    # Collect text from each page separately to handle different formats
-    page_texts = [page.extract_text() or "" for page in pdf.pages]
+    # Collect text from each page separately to handle different formats.
+    # Either way the PDF handle (and its page cache) is released here, before
+    # the scanning below, and on exceptions too.
+    if fitz is not None:
+        doc = fitz.open(pdf_path)
+        page_texts = [page.get_text("text") or "" for page in doc]
+        doc.close()
+    else:
+        with pdfplumber.open(pdf_path) as pdf:
+            page_texts = [page.extract_text() or "" for page in pdf.pages]
 
     # For joining, only apply minimal cleaning
     full_text = "\n".join(page_texts)
@@ -59,11 +234,17 @@ def extract_cornell_year(pdf_path, year_label):
     # "35 ,672" -> "35,672" (space before comma)
     # "3 5,672" -> "35,672" (space within number)
     # But DON'T merge year patterns like "2023 33,674" or "Fall 2023 33,674.0"
-    full_text = re.sub(r'(\d)\s+,', r'\1,', full_text)  # Fix space before comma
+    full_text = _RE.space_before_comma.sub(r'\1,', full_text)  # Fix space before comma
     # Fix single/double digit followed by space then digit+comma (not 4-digit year)
-    full_text = re.sub(r'(?<!\d)(\d{1,2}) (\d,\d{3})', r'\1\2', full_text)
+    full_text = _RE.split_number.sub(r'\1\2', full_text)
 
-    lines = full_text.split('\n')
+    # Lowercase the whole document once instead of once per line; the loop
+    # walks the original and lowered lines in parallel. Tuples iterate a touch
+    # faster than lists, and dropping the megabyte-scale joined strings here
+    # trims peak RSS per worker under the process pool.
+    lines = tuple(full_text.split('\n'))
+    lines_lower = tuple(full_text.lower().split('\n'))
+    del full_text, page_texts
 
     data = {
         "admissions": {
@@ -98,221 +279,288 @@ def extract_cornell_year(pdf_path, year_label):
         },
     }
 
-    # ===== ADMISSIONS (Section C1) =====
+    # State for all sections, filled in a single pass over the lines below.
+    # Admissions (Section C1)
     men_applied = women_applied = 0
     men_admitted = women_admitted = 0
     men_enrolled = women_enrolled = 0
     total_applied = total_admitted = total_enrolled = 0
+    # Early Decision
+    ed_applied = ed_admitted = 0
+    # Test scores (Section C9)
+    sat_composite_25 = sat_composite_75 = 0
+    sat_rw_25 = sat_rw_75 = 0
+    sat_math_25 = sat_math_75 = 0
+    act_25 = act_75 = 0
+    # Enrollment (Section B)
+    undergrad = 0
+    grad = 0
+    # Demographics by race (Section B2)
+    in_b2 = False
+
+    # Bind hot lookups to locals: the loop body runs for every line of every
+    # page, so each avoided attribute/key chain counts.
+    find_triggers = _TRIGGER_RE.finditer
+    finditer_bounded = _RE.num_run_bounded.finditer
+    findall_dec = _RE.decimal_num.findall
+    to_int = extract_number
+    first_in_range = _first_in_range
+    by_race = data["demographics"]["byRace"]
+    costs = data["costs"]
+    fin_aid = data["financialAid"]
+
+    # Single fused pass: each line is lowercased once and checked against every
+    # section's triggers, instead of re-walking all lines per section.
+    for line, line_lower in zip(lines, lines_lower):
+
+        # ===== DEMOGRAPHICS BY RACE (Section B2) =====
+        # The B2 state machine runs before the fast-reject gate: its header and
+        # terminator lines don't necessarily contain digits or section markers.
+        if 'B2' in line and ('ethnic' in line_lower or 'race' in line_lower):
+            in_b2 = True
+            continue
+        if in_b2 and ('B3' in line or 'B4' in line):
+            in_b2 = False
+            continue
 
-    for line in lines:
-        line_lower = line.lower()
+        # Fast reject: every block below pulls a number off the line.
+        if not any(c.isdigit() for c in line):
+            continue
 
+        # One scan of the trigger alternation tags the line; outside B2 a
+        # line without tags can't trigger any branch below.
+        tags = {m.lastgroup for m in find_triggers(line_lower)}
+        if not in_b2 and not tags:
+            continue
+
+        if in_b2:
+            race_match = _RACE_RE.search(line_lower)
+            if race_match:
+                field = _RACE_KEYWORDS[race_match.group(0)]
+                if by_race[field] == 0:
+                    # 50 < n < 15000: reasonable demographic count
+                    num = first_in_range(line, 50, 15000, finditer_bounded)
+                    if num:
+                        by_race[field] = num
+
+        # ===== ADMISSIONS (Section C1) =====
         # Format 1: "Total first-time, first-year (degree-seeking) who applied 71,164"
-        if 'degree-seeking' in line_lower and 'who applied' in line_lower:
-            nums = re.findall(r'(\d[\d,]*)', line)
-            for num_str in nums:
-                num = extract_number(num_str)
-                if 30000 < num < 100000:  # Cornell gets 40k-75k apps
-                    total_applied = num
-                    break
-
-        if 'degree-seeking' in line_lower and 'who were admitted' in line_lower:
-            nums = re.findall(r'(\d[\d,]*)', line)
-            for num_str in nums:
-                num = extract_number(num_str)
-                if 3000 < num < 15000:  # Cornell admits 4k-6k
-                    total_admitted = num
-                    break
-
-        if 'degree-seeking' in line_lower and 'enrolled' in line_lower and 'full-time' not in line_lower and 'part-time' not in line_lower:
-            nums = re.findall(r'(\d[\d,]*)', line)
-            for num_str in nums:
-                num = extract_number(num_str)
-                if 2000 < num < 6000:  # Cornell enrolls 3k-4k
-                    total_enrolled = num
-                    break
+        if 't_applied' in tags:
+            # Cornell gets 40k-75k apps
+            total_applied = first_in_range(line, 30000, 100000) or total_applied
+
+        if 't_admitted' in tags:
+            # Cornell admits 4k-6k
+            total_admitted = first_in_range(line, 3000, 15000) or total_admitted
+
+        if 't_enrolled' in tags and 'ft' not in tags and 'pt' not in tags:
+            # Cornell enrolls 3k-4k
+            total_enrolled = first_in_range(line, 2000, 6000) or total_enrolled
 
         # Format 2: "Total first-time, first-year students who applied in Fall 2023 33,674.0 34,172.0"
-        if 'students who applied in fall' in line_lower:
-            nums = re.findall(r'([\d,]+\.?\d*)', line)
-            nums = [extract_number(n) for n in nums if extract_number(n) > 10000]
+        if 'f2_applied' in tags:
+            nums = [v for v in map(to_int, findall_dec(line)) if v > 10000]
             if len(nums) >= 2:
                 men_applied = nums[0]
                 women_applied = nums[1]
 
-        if 'students admitted in fall' in line_lower:
-            nums = re.findall(r'([\d,]+\.?\d*)', line)
-            nums = [extract_number(n) for n in nums if 1000 < extract_number(n) < 10000]
+        if 'f2_admitted' in tags:
+            nums = [v for v in map(to_int, findall_dec(line)) if 1000 < v < 10000]
             if len(nums) >= 2:
                 men_admitted = nums[0]
                 women_admitted = nums[1]
 
-        if 'students enrolled in fall' in line_lower and 'full-time' not in line_lower and 'part-time' not in line_lower:
-            nums = re.findall(r'([\d,]+\.?\d*)', line)
-            nums = [extract_number(n) for n in nums if 500 < extract_number(n) < 5000]
+        if 'f2_enrolled' in tags and 'ft' not in tags and 'pt' not in tags:
+            nums = [v for v in map(to_int, findall_dec(line)) if 500 < v < 5000]
             if len(nums) >= 2:
                 men_enrolled = nums[0]
                 women_enrolled = nums[1]
 
         # Format 3: Original format "men who applied" / "women who applied"
-        if ('first-time' in line_lower or 'first-year' in line_lower or 'freshman' in line_lower):
-            if 'men who applied' in line_lower and 'women' not in line_lower:
-                nums = re.findall(r'(\d[\d,]*)', line)
-                for num_str in nums:
-                    num = extract_number(num_str)
-                    if 15000 < num < 50000:  # Men apps typically 15k-40k
-                        men_applied = num
-                        break
-            elif 'women who applied' in line_lower:
-                nums = re.findall(r'(\d[\d,]*)', line)
-                for num_str in nums:
-                    num = extract_number(num_str)
-                    if 15000 < num < 50000:
-                        women_applied = num
-                        break
+        if 'firsty' in tags:
+            if 'm_applied' in tags and 'women' not in tags and 'w_applied' not in tags:
+                # Men apps typically 15k-40k
+                men_applied = first_in_range(line, 15000, 50000) or men_applied
+            elif 'w_applied' in tags:
+                women_applied = first_in_range(line, 15000, 50000) or women_applied
 
             # Admitted
-            if 'men who were admitted' in line_lower and 'women' not in line_lower:
-                nums = re.findall(r'(\d[\d,]*)', line)
-                for num_str in nums:
-                    num = extract_number(num_str)
-                    if 1000 < num < 10000:
-                        men_admitted = num
-                        break
-            elif 'women who were admitted' in line_lower:
-                nums = re.findall(r'(\d[\d,]*)', line)
-                for num_str in nums:
-                    num = extract_number(num_str)
-                    if 1000 < num < 10000:
-                        women_admitted = num
-                        break
+            if 'm_admitted' in tags and 'women' not in tags and 'w_admitted' not in tags:
+                men_admitted = first_in_range(line, 1000, 10000) or men_admitted
+            elif 'w_admitted' in tags:
+                women_admitted = first_in_range(line, 1000, 10000) or women_admitted
 
             # Enrolled
-            if 'men who enrolled' in line_lower and 'women' not in line_lower and 'part-time' not in line_lower:
-                nums = re.findall(r'(\d[\d,]*)', line)
-                for num_str in nums:
-                    num = extract_number(num_str)
-                    if 500 < num < 5000:
-                        men_enrolled = num
-                        break
-            elif 'women who enrolled' in line_lower and 'part-time' not in line_lower:
-                nums = re.findall(r'(\d[\d,]*)', line)
-                for num_str in nums:
-                    num = extract_number(num_str)
-                    if 500 < num < 5000:
-                        women_enrolled = num
-                        break
-
-    # Use totals if found, otherwise sum gendered data
-    if total_applied > 0:
-        data["admissions"]["applied"] = total_applied
-    elif men_applied > 0 or women_applied > 0:
-        data["admissions"]["applied"] = men_applied + women_applied
-
-    if total_admitted > 0:
-        data["admissions"]["admitted"] = total_admitted
-    elif men_admitted > 0 or women_admitted > 0:
-        data["admissions"]["admitted"] = men_admitted + women_admitted
-
-    if total_enrolled > 0:
-        data["admissions"]["enrolled"] = total_enrolled
-    elif men_enrolled > 0 or women_enrolled > 0:
-        data["admissions"]["enrolled"] = men_enrolled + women_enrolled
-
-    # Calculate rates
-    if data["admissions"]["applied"] > 0 and data["admissions"]["admitted"] > 0:
-        data["admissions"]["acceptanceRate"] = round(
-            data["admissions"]["admitted"] / data["admissions"]["applied"], 4
-        )
-    if data["admissions"]["admitted"] > 0 and data["admissions"]["enrolled"] > 0:
-        data["admissions"]["yield"] = round(
-            data["admissions"]["enrolled"] / data["admissions"]["admitted"], 4
-        )
-
-    # Early Decision
-    ed_applied = ed_admitted = 0
-    for line in lines:
-        line_lower = line.lower()
-        if 'early decision' in line_lower:
+            if ('m_enrolled' in tags and 'women' not in tags and 'w_enrolled' not in tags
+                    and 'pt' not in tags):
+                men_enrolled = first_in_range(line, 500, 5000) or men_enrolled
+            elif 'w_enrolled' in tags and 'pt' not in tags:
+                women_enrolled = first_in_range(line, 500, 5000) or women_enrolled
+
+        # ===== EARLY DECISION =====
+        if 'ed' in tags:
             # Look for pattern like "Number of early decision applications received: 9555"
             if 'application' in line_lower and ('received' in line_lower or 'submitted' in line_lower):
-                nums = re.findall(r'(\d[\d,]*)', line)
-                for num_str in nums:
-                    num = extract_number(num_str)
-                    if 3000 < num < 15000:  # ED apps typically 5k-10k
-                        ed_applied = num
-                        break
+                # ED apps typically 5k-10k
+                ed_applied = first_in_range(line, 3000, 15000) or ed_applied
             elif 'admitted' in line_lower and 'plan' in line_lower:
-                nums = re.findall(r'(\d[\d,]*)', line)
-                for num_str in nums:
-                    num = extract_number(num_str)
-                    if 500 < num < 5000:  # ED admits typically 1k-2.5k
-                        ed_admitted = num
-                        break
-
-    if ed_applied > 0 and ed_admitted > 0:
-        data["admissions"]["earlyDecision"] = {"applied": ed_applied, "admitted": ed_admitted}
-
-    # ===== TEST SCORES (Section C9) =====
-    sat_composite_25 = sat_composite_75 = 0
-    sat_rw_25 = sat_rw_75 = 0
-    sat_math_25 = sat_math_75 = 0
-    act_25 = act_75 = 0
-
-    for line in lines:
-        line_lower = line.lower()
+                # ED admits typically 1k-2.5k
+                ed_admitted = first_in_range(line, 500, 5000) or ed_admitted
 
+        # ===== TEST SCORES (Section C9) =====
         # SAT Composite - look for direct composite score (1200-1600 range)
         # Avoid matching range labels like "(400 - 1600)"
-        if 'sat composite' in line_lower and 'evidence' not in line_lower:
+        if 'sat_comp' in tags and 'evid' not in tags:
             # Find scores between 1200-1560 (realistic composite scores, avoid 1600 max label)
-            scores = re.findall(r'\b(\d{4})\b', line)
+            scores = _RE.four_digit.findall(line)
             scores = [int(s) for s in scores if 1200 <= int(s) <= 1560]
             if len(scores) >= 2:
                 sat_composite_25 = min(scores)
                 sat_composite_75 = max(scores)
 
         # SAT Evidence-Based Reading and Writing (new SAT format)
-        if ('evidence-based' in line_lower or 'ebrw' in line_lower or
-            ('reading' in line_lower and 'writing' in line_lower)) and 'sat' in line_lower:
-            scores = re.findall(r'\b(\d{3})\b', line)
+        if ('evid' in tags or ('reading' in tags and 'writing' in tags)) and 'sat_w' in tags:
+            scores = _RE.three_digit.findall(line)
             scores = [int(s) for s in scores if 600 <= int(s) <= 800]  # Realistic EBRW range
             if len(scores) >= 2:
                 sat_rw_25 = min(scores)
                 sat_rw_75 = max(scores)
 
         # Handle split line: "and Writing 690 760" (continuation from previous line)
-        if line_lower.strip().startswith('and writing') and sat_rw_25 == 0:
-            scores = re.findall(r'\b(\d{3})\b', line)
+        if 'writing' in tags and sat_rw_25 == 0 and line_lower.strip().startswith('and writing'):
+            scores = _RE.three_digit.findall(line)
             scores = [int(s) for s in scores if 600 <= int(s) <= 800]
             if len(scores) >= 2:
                 sat_rw_25 = min(scores)
                 sat_rw_75 = max(scores)
 
         # SAT Critical Reading (old SAT format, pre-2016)
-        if 'critical reading' in line_lower and 'sat' in line_lower:
-            scores = re.findall(r'\b(\d{3})\b', line)
+        if 'crit_read' in tags and 'sat_w' in tags:
+            scores = _RE.three_digit.findall(line)
             scores = [int(s) for s in scores if 600 <= int(s) <= 800]
             if len(scores) >= 2 and sat_rw_25 == 0:  # Only use if no new format found
                 sat_rw_25 = min(scores)
                 sat_rw_75 = max(scores)
 
         # SAT Math
-        if 'math' in line_lower and 'sat' in line_lower and 'evidence' not in line_lower:
-            scores = re.findall(r'\b(\d{3})\b', line)
+        if 'math' in tags and 'sat_w' in tags and 'evid' not in tags:
+            scores = _RE.three_digit.findall(line)
             scores = [int(s) for s in scores if 600 <= int(s) <= 800]  # Realistic Math range
             if len(scores) >= 2:
                 sat_math_25 = min(scores)
                 sat_math_75 = max(scores)
 
         # ACT Composite
-        if 'act composite' in line_lower or ('composite' in line_lower and 'act' in line_lower):
-            scores = re.findall(r'\b(\d{2})\b', line)
+        if 'act_comp' in tags or ('composite' in tags and 'act_w' in tags):
+            scores = _RE.two_digit.findall(line)
             scores = [int(s) for s in scores if 25 <= int(s) <= 36]  # Realistic ACT range for Cornell
             if len(scores) >= 2:
                 act_25 = min(scores)
                 act_75 = max(scores)
 
+        # ===== ENROLLMENT (Section B) =====
+        # Total undergraduate enrollment
+        if ('ug_total' in tags or
+                ('undergrad_w' in tags and 'degsk' in tags and 'total_w' in tags)):
+            # Cornell undergrad ~15k
+            undergrad = first_in_range(line, 10000, 20000) or undergrad
+
+        # Graduate enrollment
+        if 'g_total' in tags:
+            # Cornell grad ~8-10k
+            grad = first_in_range(line, 5000, 15000) or grad
+
+        # ===== COSTS (Section G) =====
+        # Tuition
+        if 'tuition' in tags:
+            match = _RE.dollar_amount.search(line)
+            if match:
+                num = to_int(match.group(1))
+                if 40000 < num < 80000:  # Reasonable tuition
+                    costs["tuition"] = num
+
+        # Required fees
+        if 'req_fee' in tags:
+            match = _RE.dollar_amount.search(line)
+            if match:
+                num = to_int(match.group(1))
+                if 100 < num < 5000:  # Reasonable fees
+                    costs["fees"] = num
+
+        # Room and board
+        if 'room_board' in tags:
+            match = _RE.dollar_amount.search(line)
+            if match:
+                num = to_int(match.group(1))
+                if 10000 < num < 25000:  # Reasonable R&B
+                    costs["roomAndBoard"] = num
+
+        # Food and housing (alternate naming)
+        if 'food_housing' in tags:
+            match = _RE.dollar_amount.search(line)
+            if match:
+                num = to_int(match.group(1))
+                if 10000 < num < 25000:
+                    costs["roomAndBoard"] = num
+
+        # ===== FINANCIAL AID (Section H) =====
+        # Average need-based grant (H2 k row)
+        if 'avg_grant' in tags or 'h2k' in tags:
+            match = _RE.dollar_strict.search(line)
+            if match:
+                num = to_int(match.group(1))
+                if 30000 < num < 80000:  # Reasonable grant
+                    fin_aid["averageNeedBasedGrant"] = num
+
+        # Percent need fully met
+        if 'nfm' in tags or ('fm' in tags and 'percent_w' in tags):
+            match = _RE.percent.search(line)
+            if match:
+                pct = extract_float(match.group(1))
+                if pct > 1:
+                    pct = pct / 100
+                if 0 < pct <= 1:
+                    fin_aid["percentNeedFullyMet"] = pct
+
+        # Percent receiving need-based aid
+        if 'recv' in tags and 'needb' in tags:
+            match = _RE.percent_strict.search(line)
+            if match:
+                pct = extract_float(match.group(1))
+                if pct > 1:
+                    pct = pct / 100
+                if 0 < pct <= 1:
+                    fin_aid["percentReceivingAid"] = pct
+
+    # Use totals if found, otherwise sum gendered data
+    if total_applied > 0:
+        data["admissions"]["applied"] = total_applied
+    elif men_applied > 0 or women_applied > 0:
+        data["admissions"]["applied"] = men_applied + women_applied
+
+    if total_admitted > 0:
+        data["admissions"]["admitted"] = total_admitted
+    elif men_admitted > 0 or women_admitted > 0:
+        data["admissions"]["admitted"] = men_admitted + women_admitted
+
+    if total_enrolled > 0:
+        data["admissions"]["enrolled"] = total_enrolled
+    elif men_enrolled > 0 or women_enrolled > 0:
+        data["admissions"]["enrolled"] = men_enrolled + women_enrolled
+
+    # Calculate rates
+    if data["admissions"]["applied"] > 0 and data["admissions"]["admitted"] > 0:
+        data["admissions"]["acceptanceRate"] = round(
+            data["admissions"]["admitted"] / data["admissions"]["applied"], 4
+        )
+    if data["admissions"]["admitted"] > 0 and data["admissions"]["enrolled"] > 0:
+        data["admissions"]["yield"] = round(
+            data["admissions"]["enrolled"] / data["admissions"]["admitted"], 4
+        )
+
+    if ed_applied > 0 and ed_admitted > 0:
+        data["admissions"]["earlyDecision"] = {"applied": ed_applied, "admitted": ed_admitted}
+
     # Build SAT data - prefer direct composite, fall back to calculated
     if sat_composite_25 > 0:
         # Use direct composite scores
@@ -365,157 +613,16 @@ def extract_cornell_year(pdf_path, year_label):
             "submissionRate": 0,
         }
 
-    # ===== DEMOGRAPHICS (Section B) =====
-    undergrad = 0
-    grad = 0
-
-    for line in lines:
-        line_lower = line.lower()
-
-        # Total undergraduate enrollment
-        if ('total undergraduate' in line_lower or
-            ('undergraduate' in line_lower and 'degree-seeking' in line_lower and 'total' in line_lower) or
-            'total of all undergraduate degree-seeking' in line_lower):
-            nums = re.findall(r'(\d[\d,]*)', line)
-            for num_str in nums:
-                num = extract_number(num_str)
-                if 10000 < num < 20000:  # Cornell undergrad ~15k
-                    undergrad = num
-                    break
-
-        # Graduate enrollment
-        if 'total graduate' in line_lower or 'total of all graduate' in line_lower:
-            nums = re.findall(r'(\d[\d,]*)', line)
-            for num_str in nums:
-                num = extract_number(num_str)
-                if 5000 < num < 15000:  # Cornell grad ~8-10k
-                    grad = num
-                    break
-
     data["demographics"]["enrollment"]["undergraduate"] = undergrad
     data["demographics"]["enrollment"]["graduate"] = grad
     data["demographics"]["enrollment"]["total"] = undergrad + grad
 
-    # Demographics by race (Section B2)
-    race_keywords = {
-        'nonresident alien': 'international',
-        'international': 'international',
-        'hispanic': 'hispanicLatino',
-        'latino': 'hispanicLatino',
-        'black': 'blackAfricanAmerican',
-        'african american': 'blackAfricanAmerican',
-        'white': 'white',
-        'asian': 'asian',
-        'american indian': 'americanIndianAlaskaNative',
-        'alaska native': 'americanIndianAlaskaNative',
-        'native hawaiian': 'nativeHawaiianPacificIslander',
-        'pacific islander': 'nativeHawaiianPacificIslander',
-        'two or more': 'twoOrMoreRaces',
-        'multiracial': 'twoOrMoreRaces',
-        'race/ethnicity unknown': 'unknown',
-        'unknown': 'unknown',
-    }
-
-    # Look for B2 table data
-    in_b2 = False
-    for line in lines:
-        if 'B2' in line and ('ethnic' in line.lower() or 'race' in line.lower()):
-            in_b2 = True
-            continue
-        if in_b2 and ('B3' in line or 'B4' in line):
-            in_b2 = False
-            continue
-
-        if in_b2:
-            line_lower = line.lower()
-            for keyword, field in race_keywords.items():
-                if keyword in line_lower:
-                    nums = re.findall(r'\b(\d[\d,]*)\b', line)
-                    for num_str in nums:
-                        num = extract_number(num_str)
-                        if 50 < num < 15000:  # Reasonable demographic count
-                            if data["demographics"]["byRace"][field] == 0:
-                                data["demographics"]["byRace"][field] = num
-                            break
-                    break
-
-    # ===== COSTS (Section G) =====
-    for line in lines:
-        line_lower = line.lower()
-
-        # Tuition
-        if 'tuition' in line_lower and ('$' in line or any(c.isdigit() for c in line)):
-            match = re.search(r'\$?\s*([\d,]+)', line)
-            if match:
-                num = extract_number(match.group(1))
-                if 40000 < num < 80000:  # Reasonable tuition
-                    data["costs"]["tuition"] = num
-
-        # Required fees
-        if 'required' in line_lower and 'fee' in line_lower:
-            match = re.search(r'\$?\s*([\d,]+)', line)
-            if match:
-                num = extract_number(match.group(1))
-                if 100 < num < 5000:  # Reasonable fees
-                    data["costs"]["fees"] = num
-
-        # Room and board
-        if 'room' in line_lower and 'board' in line_lower:
-            match = re.search(r'\$?\s*([\d,]+)', line)
-            if match:
-                num = extract_number(match.group(1))
-                if 10000 < num < 25000:  # Reasonable R&B
-                    data["costs"]["roomAndBoard"] = num
-
-        # Food and housing (alternate naming)
-        if 'food and housing' in line_lower:
-            match = re.search(r'\$?\s*([\d,]+)', line)
-            if match:
-                num = extract_number(match.group(1))
-                if 10000 < num < 25000:
-                    data["costs"]["roomAndBoard"] = num
-
     data["costs"]["totalCOA"] = (
         data["costs"]["tuition"] +
         data["costs"]["fees"] +
         data["costs"]["roomAndBoard"]
     )
 
-    # ===== FINANCIAL AID (Section H) =====
-    for line in lines:
-        line_lower = line.lower()
-
-        # Average need-based grant (H2 k row)
-        if ('average' in line_lower and 'need-based' in line_lower and 'grant' in line_lower) or \
-           ('h2' in line_lower and 'k' in line_lower):
-            match = re.search(r'\$\s*([\d,]+)', line)
-            if match:
-                num = extract_number(match.group(1))
-                if 30000 < num < 80000:  # Reasonable grant
-                    data["financialAid"]["averageNeedBasedGrant"] = num
-
-        # Percent need fully met
-        if 'need fully met' in line_lower or ('fully met' in line_lower and 'percent' in line_lower):
-            match = re.search(r'(\d+\.?\d*)\s*%?', line)
-            if match:
-                pct = extract_float(match.group(1))
-                if pct > 1:
-                    pct = pct / 100
-                if 0 < pct <= 1:
-                    data["financialAid"]["percentNeedFullyMet"] = pct
-
-        # Percent receiving need-based aid
-        if 'receiving' in line_lower and 'need-based' in line_lower:
-            match = re.search(r'(\d+\.?\d*)\s*%', line)
-            if match:
-                pct = extract_float(match.group(1))
-                if pct > 1:
-                    pct = pct / 100
-                if 0 < pct <= 1:
-                    data["financialAid"]["percentReceivingAid"] = pct
-
-    pdf.close()
-
     print(f"  Applied: {data['admissions']['applied']:,}, Admitted: {data['admissions']['admitted']:,}, "
           f"Rate: {data['admissions']['acceptanceRate']:.1%}")
     if data['testScores'].get('sat'):
@@ -550,20 +657,27 @@ def main():
         "years": {}
     }
 
-    for filename, year in sorted(year_map.items(), key=lambda x: x[1]):
-        pdf_path = cornell_dir / filename
-        if pdf_path.exists():
-            year_data = extract_cornell_year(str(pdf_path), year)
-            school_data["years"][year] = year_data
-        else:
-            print(f"Warning: {pdf_path} not found")
+    # Each PDF is fully independent, so fan extraction out across cores.
+    jobs = {}
+    with ProcessPoolExecutor() as executor:
+        for filename, year in sorted(year_map.items(), key=lambda x: x[1]):
+            pdf_path = cornell_dir / filename
+            if pdf_path.exists():
+                jobs[executor.submit(extract_cornell_year, str(pdf_path), year)] = year
+            else:
+                print(f"Warning: {pdf_path} not found")
+        for future in as_completed(jobs):
+            school_data["years"][jobs[future]] = future.result()
 
     # Output
     output_path = Path("src/data/schools/cornell.json")
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w") as f:
-        json.dump(school_data, f, indent=2)
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(school_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, "w") as f:
+            json.dump(school_data, f, indent=2)
 
     print(f"\nOutput written to: {output_path}")
     print(f"Years extracted: {len(school_data['years'])}")
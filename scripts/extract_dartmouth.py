@@ -5,9 +5,13 @@ Dartmouth-specific CDS PDF Data Extractor
 Uses the proven patterns from CLAUDE.md for reliable extraction.
 """
 
+import functools
 import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 
 try:
@@ -16,35 +20,376 @@ except ImportError:
     print("Error: pdfplumber is required. Install with: pip install pdfplumber")
     sys.exit(1)
 
+try:
+    import orjson  # Optional: native JSON encoder, falls back to stdlib json
+except ImportError:
+    orjson = None
+
+
+# All patterns are compiled once at import time; the extractors run them over
+# every PDF and every year, so paying re.compile (and its cache lookups) per
+# call adds up fast. Pattern literals are lowercase and compiled without
+# re.IGNORECASE: the extractors lowercase the document once instead, which
+# keeps the regex engine's fast literal-prefix search enabled.
+
+# Number parsing (hot path: every table cell and match group)
+_NUM_STRIP = str.maketrans('', '', ', \t\r\n\x0b\x0c')
+_NUM_FIND = re.compile(r'(\d+)')
+
+# Shared numeric primitives, interpolated into the patterns below so the
+# hot character classes are literally identical everywhere
+_N = r'(\d[\d,]*)'                    # integer with optional thousands commas
+_N_DOL = r'\$?([\d,]+(?:\.\d{2})?)'   # dollar amount, optional cents
+_DOL = r'\$?([\d,]+)'                 # dollar amount, no cents
+_N5 = r'\b(\d{2},\d{3})\b'            # five-digit comma number (applicants)
+_N4 = r'\b(\d{1,2},\d{3})\b'          # four/five-digit comma number
+_PCT = r'(\d+(?:\.\d+)?)'             # percentage value
+_GAP = r'.{0,200}?'                   # bounded lazy gap between labels
+
+
+def _fuse(pattern_map):
+    """Join a {field: (pattern, ...)} map into one named-alternation regex.
+
+    A single finditer pass over the document then replaces one re.search
+    per pattern. For a match, m.lastgroup is '<field>_<i>' and the
+    branch's first capture group sits at m.lastindex + 1.
+    """
+    return '|'.join(
+        f'(?P<{field}_{i}>{pat})'
+        for field, pats in pattern_map.items()
+        for i, pat in enumerate(pats)
+    )
+
+# Admissions (Section C1) - newer format (2023-2024+) with Men and Women
+# numbers on the same line after "Fall YYYY"
+_NEWER_PATTERNS = {
+    'applied': (rf'students who applied{_GAP}fall \d{{4}}\s+(\d{{1,2}},\d{{3}}(?:\.\d)?)\s+(\d{{1,2}},\d{{3}}(?:\.\d)?)',),
+    'admitted': (rf'students admitted{_GAP}fall \d{{4}}\s+(\d{{1,3}}(?:\.\d)?)\s+(\d{{1,3}}(?:\.\d)?)',),
+    'enrolled': (r'students enrolled in fall \d{4}\s+(\d{1,3}(?:\.\d)?)\s+(\d{1,3}(?:\.\d)?)',),
+}
+_NEWER_ALT = re.compile(_fuse(_NEWER_PATTERNS))
+
+# Admissions - gendered totals (proven approach). In a fused alternation a
+# match consumes text, so each branch must stay inside its own row: the gap
+# is [^0-9]{0,200}? (a row's label never contains digits, and the previous row
+# always ends in a number), and the men_* branches use (?<!wo) so they
+# cannot latch onto the tail of a women's row.
+_GENDER_PATTERNS = {
+    'women_applied': (
+        rf'total first-time[^0-9]{{0,200}}?women who applied\s+{_N}',
+        rf'women\s+applied\s+{_N}',
+        rf'women\s+applied\s+total\s+{_N}',
+    ),
+    'men_applied': (
+        rf'total first-time[^0-9]{{0,200}}?(?<!wo)men who applied\s+{_N}',
+        rf'(?<!wo)men\s+applied\s+{_N}',
+        rf'(?<!wo)men\s+applied\s+total\s+{_N}',
+    ),
+    'women_admitted': (
+        rf'total first-time[^0-9]{{0,200}}?women who were admitted\s+{_N}',
+        rf'women\s+admitted\s+{_N}',
+    ),
+    'men_admitted': (
+        rf'total first-time[^0-9]{{0,200}}?(?<!wo)men who were admitted\s+{_N}',
+        rf'(?<!wo)men\s+admitted\s+{_N}',
+    ),
+    'women_enrolled': (
+        rf'total full-time[^0-9]{{0,200}}?women who enrolled\s+{_N}',
+        rf'total part-time[^0-9]{{0,200}}?women who enrolled\s+{_N}',
+    ),
+    'men_enrolled': (
+        rf'total full-time[^0-9]{{0,200}}?(?<!wo)men who enrolled\s+{_N}',
+        rf'total part-time[^0-9]{{0,200}}?(?<!wo)men who enrolled\s+{_N}',
+    ),
+}
+_GENDER_ALT = re.compile(_fuse(_GENDER_PATTERNS))
+
+# Table-row anchors, scanned in one pass per row instead of ~12 substring
+# tests. The whole alternation sits inside a lookahead so matches stay
+# zero-width: overlapping anchors ("total first-time" / "first-time",
+# "women who applied" / "men who applied") all report, which keeps the tag
+# set equivalent to the old `'...' in row_text` checks.
+_ROW_TRIGGER_RE = re.compile(
+    r'(?=(?P<w_applied>women who applied)'
+    r'|(?P<m_applied>men who applied)'
+    r'|(?P<w_admitted>women who were admitted)'
+    r'|(?P<m_admitted>men who were admitted)'
+    r'|(?P<w_enrolled>women who enrolled)'
+    r'|(?P<m_enrolled>men who enrolled)'
+    r'|(?P<s_applied>students who applied)'
+    r'|(?P<s_admitted>students admitted)'
+    r'|(?P<s_enrolled>students enrolled)'
+    r'|(?P<tot_first>total first-time)'
+    r'|(?P<who_applied>who applied)'
+    r'|(?P<firsttime>first-time)'
+    r'|(?P<fulltime>full-time)'
+    r'|(?P<parttime>part-time)'
+    r'|(?P<enrolled>enrolled))'
+)
+
+# Every actionable row condition requires at least one of these words, so a
+# cheap substring test prunes the vast majority of table rows before the
+# trigger scan runs
+_ROW_ANCHORS = ('applied', 'admitted', 'enrolled', 'first-time')
+
+# Admissions - C1 table totals fallback
+_TOTAL_PATTERNS = {
+    'applied': (
+        rf'total\s+first-time{_GAP}first-year{_GAP}applicants\s+{_N}',
+        rf'applicants{_GAP}total{_GAP}(\d{{2}},\d{{3}})',  # 5-digit numbers
+        rf'c1\s+first-time{_GAP}applicants{_GAP}(\d{{2}},\d{{3}})',
+    ),
+}
+_TOTAL_ALT = re.compile(_fuse(_TOTAL_PATTERNS))
+# Header row of the C1 table; the applied total sits shortly after it
+_FIRSTYEAR_HEADER_RE = re.compile(rf'total first-time{_GAP}first-year')
+_C1_SECTION_RE = re.compile(r'c1[.\s]+(.{0,20000}?)(?:c2|c3|section d)', re.DOTALL)
+_FIVE_DIGIT_RE = re.compile(_N5)
+_TABLE_NUM_RE = re.compile(_N4)
+
+# Early Decision
+_ED_PATTERNS = {
+    'applied': (
+        rf'early decision{_GAP}applicants{_GAP}{_N}',
+        rf'number of early decision applications received\s*{_N}',
+        rf'c21{_GAP}early decision{_GAP}{_N}',
+    ),
+    'admitted': (
+        rf'early decision{_GAP}admitted{_GAP}{_N}',
+        rf'number of applicants admitted under early decision plan\s*{_N}',
+        rf'admitted under early decision\s*{_N}',
+    ),
+}
+_ED_ALT = re.compile(_fuse(_ED_PATTERNS))
+
+# Test scores (Section C9)
+_ERW_PATTERNS = (
+    re.compile(rf'sat evidence-based reading{_GAP}(\d{{3}})\s*[-–]?\s*(\d{{3}})'),
+    re.compile(rf'sat ebrw{_GAP}(\d{{3}})\s*[-–]?\s*(\d{{3}})'),
+    re.compile(rf'evidence-based reading and writing{_GAP}(\d{{3}})\s+(\d{{3}})'),
+    re.compile(rf'sat evidence{_GAP}reading{_GAP}writing\s+(\d{{3}})\s+(\d{{3}})'),
+)
+_MATH_PATTERNS = (
+    re.compile(rf'sat math{_GAP}(\d{{3}})\s*[-–]?\s*(\d{{3}})'),
+    re.compile(r'math\s+(\d{3})\s+(\d{3})'),
+)
+_ACT_PATTERNS = (
+    re.compile(rf'act composite{_GAP}(\d{{2}})\s*[-–]?\s*(\d{{2}})'),
+    re.compile(r'act composite\s+(\d{2})\s+(\d{2})'),
+)
+
+# Enrollment (Section B1)
+_UNDERGRAD_PATTERNS = (
+    re.compile(rf'total{_GAP}degree-seeking{_GAP}undergraduates\s*{_N}'),
+    re.compile(rf'degree-seeking undergraduates{_GAP}total\s*{_N}'),
+    re.compile(rf'b1{_GAP}undergraduate{_GAP}{_N}'),
+    re.compile(rf'total\s+undergraduate\s+enrollment\s*{_N}'),
+)
+_GRAD_PATTERNS = (
+    re.compile(rf'total{_GAP}graduate{_GAP}enrollment\s*{_N}'),
+    re.compile(rf'graduate{_GAP}students{_GAP}total\s*{_N}'),
+)
+_COMMA_NUM_RE = re.compile(r'\b(\d,\d{3})\b')
+
+# Demographics (Section B2)
+_RACE_PATTERNS = {
+    'international': (rf'nonresident{_GAP}{_N}',
+                      rf'international{_GAP}{_N}'),
+    'hispanicLatino': (rf'hispanic{_GAP}latino{_GAP}{_N}',
+                       rf'hispanic/latino{_GAP}{_N}'),
+    'blackAfricanAmerican': (rf'black{_GAP}african{_GAP}american{_GAP}{_N}',),
+    'white': (rf'white{_GAP}{_N}',),
+    'asian': (rf'asian{_GAP}{_N}',),
+    'americanIndianAlaskaNative': (rf'american indian{_GAP}alaska{_GAP}native{_GAP}{_N}',),
+    'nativeHawaiianPacificIslander': (r'native hawaiian.{0,200}?pacific.{0,200}?islander.{0,200}?(\d[\d,]*)',),
+    'twoOrMoreRaces': (rf'two or more races{_GAP}{_N}',
+                       rf'two or more{_GAP}{_N}'),
+    'unknown': (rf'race{_GAP}ethnicity{_GAP}unknown{_GAP}{_N}',
+                rf'unknown{_GAP}{_N}'),
+}
+_RACE_ALT = re.compile(_fuse(_RACE_PATTERNS))
+
+# Row labels for the structured B2 table walk. Checked in order with
+# substring containment, so 'hispanic' sits last: most other labels carry
+# a ', non-Hispanic' suffix that would otherwise match it first.
+_RACE_LABELS = {
+    'nonresident': 'international',
+    'black or african american': 'blackAfricanAmerican',
+    'american indian': 'americanIndianAlaskaNative',
+    'native hawaiian': 'nativeHawaiianPacificIslander',
+    'two or more races': 'twoOrMoreRaces',
+    'white': 'white',
+    'asian': 'asian',
+    'unknown': 'unknown',
+    'hispanic': 'hispanicLatino',
+}
+_B2_SECTION_RE = re.compile(r'b2[.\s]+(.{0,20000}?)(?:b3|section c)', re.DOTALL)
+
+# Residency (Section F1)
+_OUT_OF_STATE_PATTERNS = (
+    re.compile(rf'out of state{_GAP}{_PCT}\s*%?'),
+    re.compile(rf'out-of-state{_GAP}{_PCT}\s*%?'),
+)
+
+# Costs (Section G)
+_COST_PATTERNS = {
+    'tuition': (
+        rf'tuition:\s*{_N_DOL}',  # Tuition: $69,207.00
+        rf'tuition[:\s]+{_DOL}',
+        rf'private institutions{_GAP}tuition:\s*{_DOL}',
+    ),
+    'fees': (
+        rf'required fees:\s*{_N_DOL}',  # Required Fees: $2,318.00
+        rf'required fees[:\s]*{_DOL}',
+    ),
+    'roomAndBoard': (
+        rf'food and housing \(on-campus\):\s*{_N_DOL}',
+        rf'food and housing[:\s]*{_DOL}',
+        rf'room and board[:\s]*{_DOL}',
+        rf'room & board[:\s]*{_DOL}',
+        # Older format: "ROOM AND BOARD:" on one line, "(on-campus) $15,756" on next
+        rf'room and board[:\s]*\(on-campus\)\s*{_DOL}',
+    ),
+}
+_COST_RANGES = {
+    'tuition': (40000, 80000),
+    'fees': (500, 5000),
+    'roomAndBoard': (10000, 25000),
+}
+_COST_ALT = re.compile(_fuse(_COST_PATTERNS))
+_DOLLAR_RE = re.compile(_DOL)
+
+# Financial aid (Section H)
+_GRANT_PATTERNS = (
+    re.compile(rf'h2\s*k{_GAP}{_DOL}'),
+    re.compile(rf'average need-based{_GAP}grant{_GAP}{_DOL}'),
+    re.compile(rf'average{_GAP}need-based{_GAP}scholarship{_GAP}grant{_GAP}{_DOL}'),
+)
+_FULLY_MET_PATTERNS = (
+    re.compile(rf'fully met{_GAP}{_PCT}\s*%'),
+    re.compile(rf'need fully met{_GAP}{_PCT}'),
+    re.compile(rf'{_PCT}\s*%{_GAP}fully met'),
+)
+_RECEIVING_PATTERNS = (
+    re.compile(rf'{_PCT}\s*%{_GAP}receiving{_GAP}need-based'),
+    re.compile(rf'receiving{_GAP}aid{_GAP}{_PCT}\s*%'),
+)
+
+# CDS section headers ('c1', 'b2', 'h2', ...) used to slice the document
+_SECTION_HEADER_RE = re.compile(r'\b([a-h]\d{1,2})[.\s]')
+
+# CDS sections the extractors actually read; H2 is the last one in document
+# order, so once all of these have appeared we can stop turning pages
+_NEEDED_SECTIONS = ('c1', 'c9', 'b1', 'b2', 'f1', 'g1', 'h2')
+# Pages that can hold the C1 admissions or B2 race tables; checking the page
+# text is far cheaper than running generic table extraction on every page
+_TABLE_PAGE_RE = re.compile(
+    r'\bc1\b|\bb2\b|who applied|students admitted|who enrolled|nonresident'
+)
+
+# Filename years
+_YEAR_RANGE_RE = re.compile(r'(\d{4})[-_](\d{4})')
+_YEAR_SINGLE_RE = re.compile(r'(\d{4})')
+
 
 def extract_number(text):
     """Extract a number from text, handling commas."""
     if not text:
         return None
-    cleaned = re.sub(r'[,\s]', '', str(text))
-    match = re.search(r'(\d+)', cleaned)
+    if not isinstance(text, str):
+        text = str(text)
+    # str.translate strips separators in one C-level pass instead of a
+    # regex substitution; this runs for every table cell and match group
+    match = _NUM_FIND.search(text.translate(_NUM_STRIP))
     return int(match.group(1)) if match else None
 
 
-def extract_pdf_text(pdf_path):
-    """Extract all text from PDF."""
+@dataclass
+class ExtractCtx:
+    """Precomputed per-PDF intermediates shared by every extractor.
+
+    Each extractor used to rebuild the joined/lowercased text (and its
+    line split) from scratch - five full copies of the largest per-PDF
+    string. Building them once here removes that churn.
+    """
+    text_joined: str
+    lines: list
+    sections: dict
+    tables: list = field(default_factory=list)
+
+    @classmethod
+    def from_text(cls, text, tables=None):
+        lower = text.lower()
+        text_joined = lower.replace('\n', ' ')
+        return cls(
+            text_joined=text_joined,
+            lines=lower.split('\n'),
+            sections=_split_sections(text_joined),
+            tables=tables if tables is not None else [],
+        )
+
+
+def _split_sections(text_joined):
+    """Slice the lowercased joined document into CDS section buffers.
+
+    Returns {label: slice} for headers like 'c1', 'b2', 'h2'. Runs of the
+    same label (H2 a, H2 b, ...) merge into one slice, and when a label
+    reappears later (table of contents, page footers) the longest slice
+    wins. Extractors then scan only their own section instead of the whole
+    document, and fall back to the full text when a label is missing.
+    """
+    marks = []
+    for m in _SECTION_HEADER_RE.finditer(text_joined):
+        label = m.group(1)
+        if marks and marks[-1][0] == label:
+            continue
+        marks.append((label, m.start()))
+
+    sections = {}
+    for i, (label, start) in enumerate(marks):
+        end = marks[i + 1][1] if i + 1 < len(marks) else len(text_joined)
+        if end - start > len(sections.get(label, '')):
+            sections[label] = text_joined[start:end]
+    return sections
+
+
+def extract_pdf_text_and_tables(pdf_path):
+    """Extract all text and tables from PDF in a single pass.
+
+    Opening the PDF once and walking the pages a single time halves the
+    parsing cost compared to separate text and table passes.  Two further
+    trims: stop turning pages once every section we extract from has been
+    seen (CDS PDFs end with sections I/J that we never read), and only run
+    the expensive table extraction on pages that look like they hold the
+    C1 or B2 tables.
+    """
+    text_parts = []
+    tables = []
+    seen = set()
     with pdfplumber.open(pdf_path) as pdf:
-        text_parts = []
         for page in pdf.pages:
             text = page.extract_text()
+            lower = ''
             if text:
                 text_parts.append(text)
-        return "\n".join(text_parts)
-
-
-def extract_pdf_tables(pdf_path):
-    """Extract all tables from PDF."""
-    tables = []
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            page_tables = page.extract_tables()
-            tables.extend(page_tables)
-    return tables
+                lower = text.lower()
+                for label in _NEEDED_SECTIONS:
+                    if label not in seen and label in lower:
+                        seen.add(label)
+            if lower and _TABLE_PAGE_RE.search(lower):
+                # C1 tables are only a fallback for the text path: when
+                # this page's text already carries the gendered totals,
+                # the table numbers are never consulted, so skip the
+                # expensive extraction.  B2 pages keep their tables since
+                # the structured race walk is the primary path there.
+                is_b2 = 'b2' in lower or 'nonresident' in lower
+                if is_b2 or not _GENDER_ALT.search(lower):
+                    tables.extend(page.extract_tables())
+            # H2 spans several pages (rows a-k), so only break once every
+            # needed section has appeared AND this page has moved past H2
+            if len(seen) == len(_NEEDED_SECTIONS) and 'h2' not in lower:
+                break
+    return "\n".join(text_parts), tables
 
 
 def extract_admissions_from_tables(tables):
@@ -58,102 +403,100 @@ def extract_admissions_from_tables(tables):
     men_applied = women_applied = 0
     men_admitted = women_admitted = 0
     men_enrolled = women_enrolled = 0
+    done = False
 
     for table in tables:
-        if not table:
+        if done or not table:
             continue
         for row in table:
+            # Once all six gendered totals are known the final sums can no
+            # longer change, so stop scanning the remaining pages
+            if (men_applied and women_applied and men_admitted
+                    and women_admitted and men_enrolled and women_enrolled):
+                done = True
+                break
             if not row:
                 continue
-            row_text = ' '.join(str(c) for c in row if c).lower()
+            row_strs = [str(c) if c is not None else '' for c in row]
+            row_text = ' '.join(row_strs).lower()
+            if not any(a in row_text for a in _ROW_ANCHORS):
+                continue
+
+            # One scan over the row text instead of a dozen substring tests
+            tags = {m.lastgroup for m in _ROW_TRIGGER_RE.finditer(row_text)}
+            if not tags:
+                continue
+
+            # Parse each cell once; every branch below reads this list
+            row_nums = [extract_number(s) for s in row_strs]
 
             # Pattern 1: Older format - "Total first-time...men who applied"
-            if 'men who applied' in row_text and 'first-time' in row_text:
-                for cell in row:
-                    num = extract_number(str(cell))
+            if 'm_applied' in tags and 'firsttime' in tags:
+                for num in row_nums:
                     if num and num > 5000:
                         men_applied = num
                         break
 
-            if 'women who applied' in row_text and 'first-time' in row_text:
-                for cell in row:
-                    num = extract_number(str(cell))
+            if 'w_applied' in tags and 'firsttime' in tags:
+                for num in row_nums:
                     if num and num > 5000:
                         women_applied = num
                         break
 
-            if 'men who were admitted' in row_text and 'first-time' in row_text:
-                for cell in row:
-                    num = extract_number(str(cell))
+            if 'm_admitted' in tags and 'firsttime' in tags:
+                for num in row_nums:
                     if num and 500 < num < 3000:
                         men_admitted = num
                         break
 
-            if 'women who were admitted' in row_text and 'first-time' in row_text:
-                for cell in row:
-                    num = extract_number(str(cell))
+            if 'w_admitted' in tags and 'firsttime' in tags:
+                for num in row_nums:
                     if num and 500 < num < 3000:
                         women_admitted = num
                         break
 
-            if 'men who enrolled' in row_text and ('first-time' in row_text or 'full-time' in row_text):
-                for cell in row:
-                    num = extract_number(str(cell))
+            if 'm_enrolled' in tags and ('firsttime' in tags or 'fulltime' in tags):
+                for num in row_nums:
                     if num and 400 < num < 1500:
                         men_enrolled = num
                         break
 
-            if 'women who enrolled' in row_text and ('first-time' in row_text or 'full-time' in row_text):
-                for cell in row:
-                    num = extract_number(str(cell))
+            if 'w_enrolled' in tags and ('firsttime' in tags or 'fulltime' in tags):
+                for num in row_nums:
                     if num and 400 < num < 1500:
                         women_enrolled = num
                         break
 
             # Pattern 2: Newer format (2023-2024+) - row with numbers for Men/Women columns
             # Format: "Total first-time...who applied in Fall 2023 | 13,516.0 | 15,325.0"
-            if 'students who applied' in row_text and 'first-time' in row_text:
+            if 's_applied' in tags and 'firsttime' in tags:
                 # Extract numeric cells
-                nums = []
-                for cell in row:
-                    num = extract_number(str(cell))
-                    if num and num > 5000:
-                        nums.append(num)
+                nums = [n for n in row_nums if n and n > 5000]
                 if len(nums) >= 2:
                     men_applied = nums[0]
                     women_applied = nums[1]
 
-            if 'students admitted' in row_text and 'first-time' in row_text:
-                nums = []
-                for cell in row:
-                    num = extract_number(str(cell))
-                    if num and 300 < num < 3000:
-                        nums.append(num)
+            if 's_admitted' in tags and 'firsttime' in tags:
+                nums = [n for n in row_nums if n and 300 < n < 3000]
                 if len(nums) >= 2:
                     men_admitted = nums[0]
                     women_admitted = nums[1]
 
-            if 'students enrolled' in row_text and 'first-time' in row_text and 'part-time' not in row_text:
-                nums = []
-                for cell in row:
-                    num = extract_number(str(cell))
-                    if num and 300 < num < 1500:
-                        nums.append(num)
+            if 's_enrolled' in tags and 'firsttime' in tags and 'parttime' not in tags:
+                nums = [n for n in row_nums if n and 300 < n < 1500]
                 if len(nums) >= 2:
                     men_enrolled = nums[0]
                     women_enrolled = nums[1]
 
             # Pattern 3: Total row format with In-State/Out-of-State/International/Total columns
-            if 'total first-time' in row_text and 'who applied' in row_text:
-                for cell in reversed(row):
-                    num = extract_number(str(cell))
+            if 'tot_first' in tags and 'who_applied' in tags:
+                for num in reversed(row_nums):
                     if num and num > 20000:
                         data['applied'] = num
                         break
 
-            if 'total first-time' in row_text and 'enrolled' in row_text and 'part-time' not in row_text:
-                for cell in reversed(row):
-                    num = extract_number(str(cell))
+            if 'tot_first' in tags and 'enrolled' in tags and 'parttime' not in tags:
+                for num in reversed(row_nums):
                     if num and 800 < num < 2000:
                         data['enrolled'] = num
                         break
@@ -169,7 +512,7 @@ def extract_admissions_from_tables(tables):
     return data
 
 
-def extract_admissions(text):
+def extract_admissions(ctx):
     """Extract admissions using gendered totals (proven approach)."""
     data = {
         "applied": 0,
@@ -179,65 +522,33 @@ def extract_admissions(text):
         "yield": 0,
     }
 
-    # Join lines to handle multi-line patterns
-    text_joined = text.replace('\n', ' ')
+    text_joined = ctx.text_joined
+    c1_text = ctx.sections.get('c1', text_joined)
 
     # Pattern for newer format (2023-2024+): "students admitted in Fall 2023 919.0 878.0"
     # This has Men and Women numbers on the same line after "Fall YYYY"
-    newer_patterns = [
-        (r'students who applied.*?Fall \d{4}\s+(\d{1,2},\d{3}(?:\.\d)?)\s+(\d{1,2},\d{3}(?:\.\d)?)', 'applied'),
-        (r'students admitted.*?Fall \d{4}\s+(\d{1,3}(?:\.\d)?)\s+(\d{1,3}(?:\.\d)?)', 'admitted'),
-        (r'students enrolled in Fall \d{4}\s+(\d{1,3}(?:\.\d)?)\s+(\d{1,3}(?:\.\d)?)', 'enrolled'),
-    ]
-
-    for pattern, field in newer_patterns:
-        match = re.search(pattern, text_joined, re.IGNORECASE)
-        if match:
-            num1 = extract_number(match.group(1)) or 0
-            num2 = extract_number(match.group(2)) or 0
-            if field == 'applied' and num1 > 5000 and num2 > 5000:
-                data[field] = num1 + num2
-            elif field == 'admitted' and 300 < num1 < 2000 and 300 < num2 < 2000:
-                data[field] = num1 + num2
-            elif field == 'enrolled' and 300 < num1 < 1000 and 300 < num2 < 1000:
-                data[field] = num1 + num2
-
-    # Approach 1: Sum men + women totals
-    patterns = {
-        'men_applied': [
-            r'Total first-time.*?men who applied\s+(\d[\d,]*)',
-            r'Men\s+Applied\s+(\d[\d,]*)',
-            r'men\s+applied\s+Total\s+(\d[\d,]*)',
-        ],
-        'women_applied': [
-            r'Total first-time.*?women who applied\s+(\d[\d,]*)',
-            r'Women\s+Applied\s+(\d[\d,]*)',
-            r'women\s+applied\s+Total\s+(\d[\d,]*)',
-        ],
-        'men_admitted': [
-            r'Total first-time.*?men who were admitted\s+(\d[\d,]*)',
-            r'Men\s+Admitted\s+(\d[\d,]*)',
-        ],
-        'women_admitted': [
-            r'Total first-time.*?women who were admitted\s+(\d[\d,]*)',
-            r'Women\s+Admitted\s+(\d[\d,]*)',
-        ],
-        'men_enrolled': [
-            r'Total full-time.*?men who enrolled\s+(\d[\d,]*)',
-            r'Total part-time.*?men who enrolled\s+(\d[\d,]*)',
-        ],
-        'women_enrolled': [
-            r'Total full-time.*?women who enrolled\s+(\d[\d,]*)',
-            r'Total part-time.*?women who enrolled\s+(\d[\d,]*)',
-        ],
-    }
-
+    for m in _NEWER_ALT.finditer(c1_text):
+        if data['applied'] and data['admitted'] and data['enrolled']:
+            break
+        field = m.lastgroup.rsplit('_', 1)[0]
+        if data[field]:
+            continue
+        num1 = extract_number(m.group(m.lastindex + 1)) or 0
+        num2 = extract_number(m.group(m.lastindex + 2)) or 0
+        if field == 'applied' and num1 > 5000 and num2 > 5000:
+            data[field] = num1 + num2
+        elif field == 'admitted' and 300 < num1 < 2000 and 300 < num2 < 2000:
+            data[field] = num1 + num2
+        elif field == 'enrolled' and 300 < num1 < 1000 and 300 < num2 < 1000:
+            data[field] = num1 + num2
+
+    # Approach 1: Sum men + women totals (first hit per field wins)
     values = {}
-    for key, pats in patterns.items():
-        for pat in pats:
-            match = re.search(pat, text_joined, re.IGNORECASE)
-            if match:
-                values[key] = extract_number(match.group(1)) or 0
+    for m in _GENDER_ALT.finditer(c1_text):
+        key = m.lastgroup.rsplit('_', 1)[0]
+        if key not in values:
+            values[key] = extract_number(m.group(m.lastindex + 1)) or 0
+            if len(values) == len(_GENDER_PATTERNS):
                 break
 
     # Sum gendered values
@@ -252,46 +563,38 @@ def extract_admissions(text):
     if data['applied'] == 0:
         # Look for patterns like "Total applicants ... 28,336"
         # Or table rows with Men/Women/Another Gender/Total columns
-        total_patterns = [
-            r'Total\s+first-time.*?first-year.*?applicants\s+(\d[\d,]*)',
-            r'applicants[^\n]*Total[^\n]*(\d{2},\d{3})',  # 5-digit numbers
-            r'C1\s+First-time[^\n]*applicants[^\n]*(\d{2},\d{3})',
-        ]
-        for pat in total_patterns:
-            match = re.search(pat, text_joined, re.IGNORECASE)
-            if match:
-                num = extract_number(match.group(1))
-                if num and num > 10000:  # Sanity check for total apps
-                    data['applied'] = num
-                    break
+        for m in _TOTAL_ALT.finditer(text_joined):
+            num = extract_number(m.group(m.lastindex + 1))
+            if num and num > 10000:  # Sanity check for total apps
+                data['applied'] = num
+                break
 
     # Approach 3: Search for specific sections
     if data['applied'] == 0:
         # Find the C1 section
-        c1_match = re.search(r'C1[.\s]+(.*?)(?:C2|C3|Section D)', text_joined, re.IGNORECASE | re.DOTALL)
+        c1_match = _C1_SECTION_RE.search(text_joined)
         if c1_match:
             c1_text = c1_match.group(1)
             # Look for large numbers (5 digits) which are likely total apps
-            numbers = re.findall(r'\b(\d{2},\d{3})\b', c1_text)
+            numbers = _FIVE_DIGIT_RE.findall(c1_text)
             if numbers:
                 # First large number is often total applied
                 data['applied'] = extract_number(numbers[0]) or 0
 
-    # Look for table format: row with "Total first-time first-year" followed by numbers
-    # Only use this fallback if we haven't found applied yet
+    # Look for table format: "Total first-time first-year" header followed by
+    # numbers. Only use this fallback if we haven't found applied yet
     if data['applied'] == 0:
-        lines = text.split('\n')
-        for i, line in enumerate(lines):
-            line_lower = line.lower()
-            if 'total first-time' in line_lower and 'first-year' in line_lower:
-                # Extract numbers from this and next few lines
-                combined = ' '.join(lines[i:i+5])
-                numbers = re.findall(r'\b(\d{1,2},\d{3})\b', combined)
-                large_nums = [extract_number(n) for n in numbers if extract_number(n) and extract_number(n) > 5000]
-                if len(large_nums) >= 1:
-                    # Largest is usually total applied
-                    data['applied'] = max(large_nums)
-                    break
+        for m in _FIRSTYEAR_HEADER_RE.finditer(text_joined):
+            # Comma numbers in a short window after the header; largest is
+            # usually total applied
+            window = text_joined[m.end():m.end() + 400]
+            large_nums = [
+                n for n in map(extract_number, _TABLE_NUM_RE.findall(window))
+                if n and n > 5000
+            ]
+            if large_nums:
+                data['applied'] = max(large_nums)
+                break
 
     # Calculate rates
     if data['applied'] > 0 and data['admitted'] > 0:
@@ -299,48 +602,30 @@ def extract_admissions(text):
     if data['admitted'] > 0 and data['enrolled'] > 0:
         data['yield'] = round(data['enrolled'] / data['admitted'], 4)
 
-    # Early Decision
-    ed_applied = None
-    ed_admitted = None
-
-    # Look for ED patterns
-    ed_patterns_applied = [
-        r'Early Decision.*?applicants.*?(\d[\d,]*)',
-        r'Number of early decision applications received\s*(\d[\d,]*)',
-        r'C21.*?early decision.*?(\d[\d,]*)',
-    ]
-    ed_patterns_admitted = [
-        r'Early Decision.*?admitted.*?(\d[\d,]*)',
-        r'Number of applicants admitted under early decision plan\s*(\d[\d,]*)',
-        r'admitted under early decision\s*(\d[\d,]*)',
-    ]
-
-    for pat in ed_patterns_applied:
-        match = re.search(pat, text_joined, re.IGNORECASE)
-        if match:
-            num = extract_number(match.group(1))
-            if num and 500 < num < 5000:  # Reasonable ED range
-                ed_applied = num
-                break
-
-    for pat in ed_patterns_admitted:
-        match = re.search(pat, text_joined, re.IGNORECASE)
-        if match:
-            num = extract_number(match.group(1))
-            if num and 200 < num < 2000:
-                ed_admitted = num
-                break
+    # Early Decision (C21/C22; headers vary, so default to the full text)
+    ed = {}
+    for m in _ED_ALT.finditer(ctx.sections.get('c21', text_joined)):
+        field = m.lastgroup.rsplit('_', 1)[0]
+        if field in ed:
+            continue
+        num = extract_number(m.group(m.lastindex + 1))
+        if field == 'applied' and num and 500 < num < 5000:  # Reasonable ED range
+            ed[field] = num
+        elif field == 'admitted' and num and 200 < num < 2000:
+            ed[field] = num
+        if len(ed) == 2:
+            break
 
-    if ed_applied and ed_admitted:
-        data['earlyDecision'] = {'applied': ed_applied, 'admitted': ed_admitted}
+    if len(ed) == 2:
+        data['earlyDecision'] = ed
 
     return data
 
 
-def extract_test_scores(text):
+def extract_test_scores(ctx):
     """Extract SAT/ACT scores from Section C9."""
     data = {}
-    text_joined = text.replace('\n', ' ')
+    c9_text = ctx.sections.get('c9', ctx.text_joined)
 
     sat_data = {
         "composite": {"p25": 0, "p50": 0, "p75": 0},
@@ -350,15 +635,8 @@ def extract_test_scores(text):
     }
 
     # SAT ERW: Look for "SAT Evidence-Based Reading and Writing" or "SAT EBRW"
-    erw_patterns = [
-        r'SAT Evidence-Based Reading.*?(\d{3})\s*[-–]?\s*(\d{3})',
-        r'SAT EBRW.*?(\d{3})\s*[-–]?\s*(\d{3})',
-        r'Evidence-Based Reading and Writing.*?(\d{3})\s+(\d{3})',
-        r'SAT Evidence.*?Reading.*?Writing\s+(\d{3})\s+(\d{3})',
-    ]
-
-    for pat in erw_patterns:
-        match = re.search(pat, text_joined, re.IGNORECASE)
+    for pat in _ERW_PATTERNS:
+        match = pat.search(c9_text)
         if match:
             p25 = int(match.group(1))
             p75 = int(match.group(2))
@@ -369,13 +647,8 @@ def extract_test_scores(text):
                 break
 
     # SAT Math
-    math_patterns = [
-        r'SAT Math.*?(\d{3})\s*[-–]?\s*(\d{3})',
-        r'Math\s+(\d{3})\s+(\d{3})',
-    ]
-
-    for pat in math_patterns:
-        match = re.search(pat, text_joined, re.IGNORECASE)
+    for pat in _MATH_PATTERNS:
+        match = pat.search(c9_text)
         if match:
             p25 = int(match.group(1))
             p75 = int(match.group(2))
@@ -398,13 +671,8 @@ def extract_test_scores(text):
         "submissionRate": 0,
     }
 
-    act_patterns = [
-        r'ACT Composite.*?(\d{2})\s*[-–]?\s*(\d{2})',
-        r'ACT Composite\s+(\d{2})\s+(\d{2})',
-    ]
-
-    for pat in act_patterns:
-        match = re.search(pat, text_joined, re.IGNORECASE)
+    for pat in _ACT_PATTERNS:
+        match = pat.search(c9_text)
         if match:
             p25 = int(match.group(1))
             p75 = int(match.group(2))
@@ -418,7 +686,7 @@ def extract_test_scores(text):
     return data
 
 
-def extract_demographics(text):
+def extract_demographics(ctx):
     """Extract enrollment and demographic data from Section B."""
     data = {
         "enrollment": {"total": 0, "undergraduate": 0, "graduate": 0},
@@ -436,18 +704,12 @@ def extract_demographics(text):
         "byResidency": {"inState": 0, "outOfState": 0, "international": 0},
     }
 
-    text_joined = text.replace('\n', ' ')
+    text_joined = ctx.text_joined
+    b1_text = ctx.sections.get('b1', text_joined)
 
     # Undergraduate enrollment - look for B1 section totals
-    undergrad_patterns = [
-        r'Total.*?degree-seeking.*?undergraduates\s*(\d[\d,]*)',
-        r'degree-seeking undergraduates.*?Total\s*(\d[\d,]*)',
-        r'B1.*?undergraduate.*?(\d[\d,]*)',
-        r'Total\s+undergraduate\s+enrollment\s*(\d[\d,]*)',
-    ]
-
-    for pat in undergrad_patterns:
-        match = re.search(pat, text_joined, re.IGNORECASE)
+    for pat in _UNDERGRAD_PATTERNS:
+        match = pat.search(b1_text)
         if match:
             num = extract_number(match.group(1))
             if num and 3000 < num < 6000:  # Dartmouth undergrad range
@@ -457,10 +719,9 @@ def extract_demographics(text):
     # If still 0, search more broadly
     if data["enrollment"]["undergraduate"] == 0:
         # Look for numbers near "undergraduate" or "undergrad"
-        lines = text.split('\n')
-        for line in lines:
-            if 'undergraduate' in line.lower() or 'degree-seeking' in line.lower():
-                nums = re.findall(r'\b(\d,\d{3})\b', line)
+        for line in ctx.lines:
+            if 'undergraduate' in line or 'degree-seeking' in line:
+                nums = _COMMA_NUM_RE.findall(line)
                 for n in nums:
                     num = extract_number(n)
                     if num and 3000 < num < 6000:
@@ -468,13 +729,8 @@ def extract_demographics(text):
                         break
 
     # Graduate enrollment
-    grad_patterns = [
-        r'Total.*?graduate.*?enrollment\s*(\d[\d,]*)',
-        r'graduate.*?students.*?Total\s*(\d[\d,]*)',
-    ]
-
-    for pat in grad_patterns:
-        match = re.search(pat, text_joined, re.IGNORECASE)
+    for pat in _GRAD_PATTERNS:
+        match = pat.search(b1_text)
         if match:
             num = extract_number(match.group(1))
             if num and 500 < num < 3000:
@@ -483,41 +739,55 @@ def extract_demographics(text):
 
     data["enrollment"]["total"] = data["enrollment"]["undergraduate"] + data["enrollment"]["graduate"]
 
-    # Demographics from B2 section
-    race_patterns = {
-        'international': [r'Nonresident.*?(\d[\d,]*)', r'International.*?(\d[\d,]*)'],
-        'hispanicLatino': [r'Hispanic.*?Latino.*?(\d[\d,]*)', r'Hispanic/Latino.*?(\d[\d,]*)'],
-        'blackAfricanAmerican': [r'Black.*?African.*?American.*?(\d[\d,]*)'],
-        'white': [r'White.*?(\d[\d,]*)'],
-        'asian': [r'Asian.*?(\d[\d,]*)'],
-        'americanIndianAlaskaNative': [r'American Indian.*?Alaska.*?Native.*?(\d[\d,]*)'],
-        'nativeHawaiianPacificIslander': [r'Native Hawaiian.*?Pacific.*?Islander.*?(\d[\d,]*)'],
-        'twoOrMoreRaces': [r'Two or more races.*?(\d[\d,]*)', r'Two or More.*?(\d[\d,]*)'],
-        'unknown': [r'Race.*?ethnicity.*?unknown.*?(\d[\d,]*)', r'Unknown.*?(\d[\d,]*)'],
-    }
-
-    # Search in B2 section area
-    b2_match = re.search(r'B2[.\s]+(.*?)(?:B3|Section C)', text_joined, re.IGNORECASE | re.DOTALL)
-    search_text = b2_match.group(1) if b2_match else text_joined
+    # Demographics from B2: walk the extracted tables first - a structured
+    # label->column lookup beats greedy regex matching on prefixes like
+    # "White.*?" - and only fall back to the regex scan when no B2-style
+    # table rows were found
+    race_limit = data["enrollment"]["undergraduate"] * 0.7
+    by_race = data["byRace"]
+    if ctx.tables:
+        for table in ctx.tables:
+            for row in table or ():
+                if not row or not row[0]:
+                    continue
+                label = str(row[0]).lower()
+                for key, category in _RACE_LABELS.items():
+                    if key in label:
+                        break
+                else:
+                    continue
+                if by_race[category]:
+                    continue
+                # Rightmost in-range column is the total-undergraduate count
+                for cell in reversed(row[1:]):
+                    num = extract_number(cell)
+                    if num and 0 < num < race_limit:
+                        by_race[category] = num
+                        break
 
-    for category, patterns in race_patterns.items():
-        for pat in patterns:
-            match = re.search(pat, search_text, re.IGNORECASE)
-            if match:
-                num = extract_number(match.group(1))
-                if num and num > 0 and num < data["enrollment"]["undergraduate"] * 0.7:
-                    data["byRace"][category] = num
-                    break
+    # Per-category fallback: pdfplumber is known to mangle tables while
+    # text extraction still works, so a partial table walk must not
+    # suppress the regex pass for the categories it missed. The guard in
+    # the loop keeps table-sourced values authoritative.
+    if not all(by_race.values()):
+        search_text = ctx.sections.get('b2')
+        if search_text is None:
+            b2_match = _B2_SECTION_RE.search(text_joined)
+            search_text = b2_match.group(1) if b2_match else text_joined
+
+        for m in _RACE_ALT.finditer(search_text):
+            category = m.lastgroup.rsplit('_', 1)[0]
+            if by_race[category]:
+                continue
+            num = extract_number(m.group(m.lastindex + 1))
+            if num and 0 < num < race_limit:
+                by_race[category] = num
 
     # Residency from F1 section
     # F1 shows "Percent who are from out of state"
-    out_of_state_patterns = [
-        r'out of state.*?(\d+(?:\.\d+)?)\s*%?',
-        r'out-of-state.*?(\d+(?:\.\d+)?)\s*%?',
-    ]
-
-    for pat in out_of_state_patterns:
-        match = re.search(pat, text_joined, re.IGNORECASE)
+    f1_text = ctx.sections.get('f1', text_joined)
+    for pat in _OUT_OF_STATE_PATTERNS:
+        match = pat.search(f1_text)
         if match:
             out_pct = float(match.group(1))
             if out_pct > 1:  # It's a percentage like 96
@@ -539,69 +809,29 @@ def extract_demographics(text):
     return data
 
 
-def extract_costs(text):
+def extract_costs(ctx):
     """Extract cost data from Section G."""
     data = {"tuition": 0, "fees": 0, "roomAndBoard": 0, "totalCOA": 0}
 
-    text_joined = text.replace('\n', ' ')
-
-    # Tuition patterns - look for dollar amounts after Tuition:
-    tuition_patterns = [
-        r'Tuition:\s*\$?([\d,]+(?:\.\d{2})?)',  # Tuition: $69,207.00
-        r'Tuition[:\s]+\$?([\d,]+)',
-        r'PRIVATE INSTITUTIONS.*?Tuition:\s*\$?([\d,]+)',
-    ]
-
-    for pat in tuition_patterns:
-        match = re.search(pat, text_joined, re.IGNORECASE)
-        if match:
-            num = extract_number(match.group(1))
-            if num and 40000 < num < 80000:
-                data["tuition"] = num
-                break
-
-    # Fees patterns
-    fees_patterns = [
-        r'Required Fees:\s*\$?([\d,]+(?:\.\d{2})?)',  # Required Fees: $2,318.00
-        r'REQUIRED FEES[:\s]*\$?([\d,]+)',
-        r'Required fees[:\s]*\$?([\d,]+)',
-    ]
-
-    for pat in fees_patterns:
-        match = re.search(pat, text_joined, re.IGNORECASE)
-        if match:
-            num = extract_number(match.group(1))
-            if num and 500 < num < 5000:
-                data["fees"] = num
-                break
-
-    # Room and Board patterns - also match "Food and housing"
-    rb_patterns = [
-        r'Food and housing \(on-campus\):\s*\$?([\d,]+(?:\.\d{2})?)',  # Food and housing (on-campus): $20,920.00
-        r'Food and [Hh]ousing[:\s]*\$?([\d,]+)',
-        r'Room and [Bb]oard[:\s]*\$?([\d,]+)',
-        r'Room & [Bb]oard[:\s]*\$?([\d,]+)',
-        r'ROOM AND BOARD[:\s]*\$?([\d,]+)',
-        # Older format: "ROOM AND BOARD:" on one line, "(on-campus) $15,756" on next
-        r'ROOM AND BOARD[:\s]*\(on-campus\)\s*\$?([\d,]+)',
-    ]
-
-    for pat in rb_patterns:
-        match = re.search(pat, text_joined, re.IGNORECASE)
-        if match:
-            num = extract_number(match.group(1))
-            if num and 10000 < num < 25000:
-                data["roomAndBoard"] = num
-                break
+    # Tuition / fees / room & board in one pass; first in-range hit per
+    # field wins
+    for m in _COST_ALT.finditer(ctx.sections.get('g1', ctx.text_joined)):
+        field = m.lastgroup.rsplit('_', 1)[0]
+        if data[field]:
+            continue
+        num = extract_number(m.group(m.lastindex + 1))
+        lo, hi = _COST_RANGES[field]
+        if num and lo < num < hi:
+            data[field] = num
 
     # Fallback: Look for room and board in lines
     if data["roomAndBoard"] == 0:
-        lines = text.split('\n')
+        lines = ctx.lines
         for i, line in enumerate(lines):
-            if 'ROOM AND BOARD' in line.upper() and i + 1 < len(lines):
+            if 'room and board' in line and i + 1 < len(lines):
                 # Check next line for amount
                 next_line = lines[i + 1]
-                match = re.search(r'\$?([\d,]+)', next_line)
+                match = _DOLLAR_RE.search(next_line)
                 if match:
                     num = extract_number(match.group(1))
                     if num and 10000 < num < 25000:
@@ -614,7 +844,7 @@ def extract_costs(text):
     return data
 
 
-def extract_financial_aid(text):
+def extract_financial_aid(ctx):
     """Extract financial aid data from Section H."""
     data = {
         "percentReceivingAid": 0,
@@ -623,17 +853,11 @@ def extract_financial_aid(text):
         "percentNeedFullyMet": 0,
     }
 
-    text_joined = text.replace('\n', ' ')
+    h2_text = ctx.sections.get('h2', ctx.text_joined)
 
     # Average need-based grant (H2 K)
-    grant_patterns = [
-        r'H2\s*k.*?\$?([\d,]+)',
-        r'average need-based.*?grant.*?\$?([\d,]+)',
-        r'Average.*?need-based.*?scholarship.*?grant.*?\$?([\d,]+)',
-    ]
-
-    for pat in grant_patterns:
-        match = re.search(pat, text_joined, re.IGNORECASE)
+    for pat in _GRANT_PATTERNS:
+        match = pat.search(h2_text)
         if match:
             num = extract_number(match.group(1))
             if num and 30000 < num < 80000:
@@ -641,14 +865,8 @@ def extract_financial_aid(text):
                 break
 
     # Percent need fully met
-    fully_met_patterns = [
-        r'fully met.*?(\d+(?:\.\d+)?)\s*%',
-        r'need fully met.*?(\d+(?:\.\d+)?)',
-        r'(\d+(?:\.\d+)?)\s*%.*?fully met',
-    ]
-
-    for pat in fully_met_patterns:
-        match = re.search(pat, text_joined, re.IGNORECASE)
+    for pat in _FULLY_MET_PATTERNS:
+        match = pat.search(h2_text)
         if match:
             val = float(match.group(1))
             if val > 1:  # It's a percentage like 100
@@ -662,13 +880,8 @@ def extract_financial_aid(text):
         data["percentNeedFullyMet"] = 1.0
 
     # Percent receiving aid
-    receiving_patterns = [
-        r'(\d+(?:\.\d+)?)\s*%.*?receiving.*?need-based',
-        r'receiving.*?aid.*?(\d+(?:\.\d+)?)\s*%',
-    ]
-
-    for pat in receiving_patterns:
-        match = re.search(pat, text_joined, re.IGNORECASE)
+    for pat in _RECEIVING_PATTERNS:
+        match = pat.search(h2_text)
         if match:
             val = float(match.group(1))
             if val > 1:
@@ -680,24 +893,83 @@ def extract_financial_aid(text):
     return data
 
 
+@functools.lru_cache(maxsize=None)
 def extract_year_from_filename(filename):
     """Extract academic year from filename."""
-    patterns = [
-        r'(\d{4})[-_](\d{4})',
-        r'(\d{4})',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, filename)
-        if match:
-            if len(match.groups()) == 2:
-                return f"{match.group(1)}-{match.group(2)}"
-            else:
-                year = int(match.group(1))
-                return f"{year}-{year + 1}"
+    match = _YEAR_RANGE_RE.search(filename)
+    if match:
+        return f"{match.group(1)}-{match.group(2)}"
+    match = _YEAR_SINGLE_RE.search(filename)
+    if match:
+        year = int(match.group(1))
+        return f"{year}-{year + 1}"
     return "unknown"
 
 
+def _process_one_pdf(pdf_file):
+    """Run the full extraction pipeline for a single PDF.
+
+    Top-level so it can be dispatched to worker processes; returns
+    (year, year_data), with year_data None if extraction blew up.
+    """
+    year = extract_year_from_filename(pdf_file.name)
+    print(f"Processing {pdf_file.name} ({year})...")
+
+    try:
+        text, tables = extract_pdf_text_and_tables(pdf_file)
+
+        # Build the shared intermediates (joined/lowered text, line split,
+        # section slices) once for all extractors
+        ctx = ExtractCtx.from_text(text, tables)
+
+        # Try text-based extraction first
+        admissions_data = extract_admissions(ctx)
+
+        # If text extraction failed or got low numbers, try table extraction
+        if admissions_data['applied'] < 15000 or admissions_data['admitted'] == 0:
+            table_admissions = extract_admissions_from_tables(tables)
+            if table_admissions['applied'] > admissions_data['applied']:
+                admissions_data['applied'] = table_admissions['applied']
+            if table_admissions['admitted'] > admissions_data['admitted']:
+                admissions_data['admitted'] = table_admissions['admitted']
+            if table_admissions['enrolled'] > admissions_data['enrolled']:
+                admissions_data['enrolled'] = table_admissions['enrolled']
+
+            # Recalculate rates
+            if admissions_data['applied'] > 0 and admissions_data['admitted'] > 0:
+                admissions_data['acceptanceRate'] = round(
+                    admissions_data['admitted'] / admissions_data['applied'], 4)
+            if admissions_data['admitted'] > 0 and admissions_data['enrolled'] > 0:
+                admissions_data['yield'] = round(
+                    admissions_data['enrolled'] / admissions_data['admitted'], 4)
+
+        year_data = {
+            "admissions": admissions_data,
+            "testScores": extract_test_scores(ctx),
+            "demographics": extract_demographics(ctx),
+            "costs": extract_costs(ctx),
+            "financialAid": extract_financial_aid(ctx),
+        }
+
+        # Print summary
+        adm = year_data["admissions"]
+        rate = adm.get('acceptanceRate', 0)
+        print(f"  Applied: {adm['applied']:,}, Admitted: {adm['admitted']:,}, "
+              f"Rate: {rate:.1%}")
+        if year_data["testScores"].get("sat"):
+            sat = year_data["testScores"]["sat"]["composite"]
+            print(f"  SAT: {sat['p25']}-{sat['p75']}")
+        print(f"  COA: ${year_data['costs']['totalCOA']:,}")
+
+        return year, year_data
+
+    except Exception as e:
+        print(f"  Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return year, None
+
+
 def process_dartmouth():
     """Process all Dartmouth PDFs."""
     pdf_dir = Path("College-Data/Dartmouth")
@@ -709,64 +981,21 @@ def process_dartmouth():
         "years": {},
     }
 
-    for pdf_file in pdf_files:
-        year = extract_year_from_filename(pdf_file.name)
-        print(f"Processing {pdf_file.name} ({year})...")
-
-        try:
-            text = extract_pdf_text(str(pdf_file))
-            tables = extract_pdf_tables(str(pdf_file))
-
-            # Try text-based extraction first
-            admissions_data = extract_admissions(text)
-
-            # If text extraction failed or got low numbers, try table extraction
-            if admissions_data['applied'] < 15000 or admissions_data['admitted'] == 0:
-                table_admissions = extract_admissions_from_tables(tables)
-                if table_admissions['applied'] > admissions_data['applied']:
-                    admissions_data['applied'] = table_admissions['applied']
-                if table_admissions['admitted'] > admissions_data['admitted']:
-                    admissions_data['admitted'] = table_admissions['admitted']
-                if table_admissions['enrolled'] > admissions_data['enrolled']:
-                    admissions_data['enrolled'] = table_admissions['enrolled']
-
-                # Recalculate rates
-                if admissions_data['applied'] > 0 and admissions_data['admitted'] > 0:
-                    admissions_data['acceptanceRate'] = round(
-                        admissions_data['admitted'] / admissions_data['applied'], 4)
-                if admissions_data['admitted'] > 0 and admissions_data['enrolled'] > 0:
-                    admissions_data['yield'] = round(
-                        admissions_data['enrolled'] / admissions_data['admitted'], 4)
-
-            year_data = {
-                "admissions": admissions_data,
-                "testScores": extract_test_scores(text),
-                "demographics": extract_demographics(text),
-                "costs": extract_costs(text),
-                "financialAid": extract_financial_aid(text),
-            }
-
-            school_data["years"][year] = year_data
-
-            # Print summary
-            adm = year_data["admissions"]
-            rate = adm.get('acceptanceRate', 0)
-            print(f"  Applied: {adm['applied']:,}, Admitted: {adm['admitted']:,}, "
-                  f"Rate: {rate:.1%}")
-            if year_data["testScores"].get("sat"):
-                sat = year_data["testScores"]["sat"]["composite"]
-                print(f"  SAT: {sat['p25']}-{sat['p75']}")
-            print(f"  COA: ${year_data['costs']['totalCOA']:,}")
-
-        except Exception as e:
-            print(f"  Error: {e}")
-            import traceback
-            traceback.print_exc()
+    # Each PDF is fully independent, so fan the pipeline out across cores;
+    # pdfplumber + regex are CPU-bound, which processes (unlike threads)
+    # actually parallelize.
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        for year, year_data in ex.map(_process_one_pdf, pdf_files):
+            if year_data is not None:
+                school_data["years"][year] = year_data
 
     # Write output
     output_path = Path("src/data/schools/dartmouth.json")
-    with open(output_path, "w") as f:
-        json.dump(school_data, f, indent=2)
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(school_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, "w") as f:
+            json.dump(school_data, f, indent=2)
 
     print(f"\nOutput written to: {output_path}")
     return school_data
@@ -5,9 +5,13 @@ Northwestern-specific CDS PDF Data Extractor
 Uses targeted patterns for Northwestern University CDS PDFs.
 """
 
+import hashlib
 import json
+import os
+import pickle
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 try:
@@ -16,40 +20,334 @@ except ImportError:
     print("Error: pdfplumber is required. Install with: pip install pdfplumber")
     sys.exit(1)
 
+try:
+    import orjson  # Optional: native JSON encoder, falls back to stdlib json
+except ImportError:
+    orjson = None
+
+
+# All patterns are compiled once at import time: the extractors run them for
+# every PDF, and Python's small re cache evicts wholesale once it overflows,
+# so per-call re.search with string literals recompiles on the hot path.
+
+
+def _fuse(pattern_map):
+    """Join a {field: (pattern, ...)} map into one named-alternation regex.
+
+    Lets one finditer pass over the document stand in for a search per
+    pattern; m.lastgroup identifies the matching branch as '<field>_<i>'
+    and its first capture group is m.group(m.lastindex + 1).
+    """
+    return '|'.join(
+        f'(?P<{field}_{i}>{pat})'
+        for field, pats in pattern_map.items()
+        for i, pat in enumerate(pats)
+    )
+
+# Admissions (Section C1) - gendered totals. Fused branches consume text, so
+# each one must stay inside its own row: the gap is [^0-9]{0,200}? (row
+# labels carry no digits and the previous row ends in a number) and the
+# men_* branches use (?<!wo) so they cannot match inside a women's row.
+# Women's branches come first so they win shared start positions.
+_GENDER_PATTERNS = {
+    'women_applied': (
+        r'Total first-time[^0-9]{0,200}?women who applied\s+(\d[\d,]*)',
+        r'first-time[^0-9]{0,200}?first-year[^0-9]{0,200}?women who applied\s+(\d[\d,]*)',
+    ),
+    'men_applied': (
+        r'Total first-time[^0-9]{0,200}?(?<!wo)men who applied\s+(\d[\d,]*)',
+        r'first-time[^0-9]{0,200}?first-year[^0-9]{0,200}?(?<!wo)men who applied\s+(\d[\d,]*)',
+    ),
+    'women_admitted': (
+        r'Total first-time[^0-9]{0,200}?women who were admitted\s+(\d[\d,]*)',
+        r'first-time[^0-9]{0,200}?first-year[^0-9]{0,200}?women who were admitted\s+(\d[\d,]*)',
+    ),
+    'men_admitted': (
+        r'Total first-time[^0-9]{0,200}?(?<!wo)men who were admitted\s+(\d[\d,]*)',
+        r'first-time[^0-9]{0,200}?first-year[^0-9]{0,200}?(?<!wo)men who were admitted\s+(\d[\d,]*)',
+    ),
+    'women_enrolled': (
+        r'Total full-time[^0-9]{0,200}?women who enrolled\s+(\d[\d,]*)',
+        r'full-time[^0-9]{0,200}?first-year[^0-9]{0,200}?women who enrolled\s+(\d[\d,]*)',
+    ),
+    'men_enrolled': (
+        r'Total full-time[^0-9]{0,200}?(?<!wo)men who enrolled\s+(\d[\d,]*)',
+        r'full-time[^0-9]{0,200}?first-year[^0-9]{0,200}?(?<!wo)men who enrolled\s+(\d[\d,]*)',
+    ),
+}
+_GENDER_ALT = re.compile(_fuse(_GENDER_PATTERNS), re.IGNORECASE)
+
+# Admissions fallback and table helpers
+_FIVE_DIGIT_RE = re.compile(r'\b(\d{2},\d{3})\b')
+# All comma integers in a row's text, pulled in one C-level findall
+# instead of running extract_number per cell
+_INT_RE = re.compile(r'(\d[\d,]*)')
+
+# Table-row keywords, found in one scan per row instead of ~10 substring
+# tests. The alternation sits inside a lookahead so matches are zero-width:
+# overlapping keywords ("men who applied" inside "women who applied",
+# "first-time" inside "Total first-time...") all report, keeping the tag
+# set equivalent to the old `'...' in row_text` checks.
+_ROW_TRIGGER_RE = re.compile(
+    r'(?=(?P<w_applied>women who applied)'
+    r'|(?P<m_applied>men who applied)'
+    r'|(?P<w_admitted>women who were admitted)'
+    r'|(?P<m_admitted>men who were admitted)'
+    r'|(?P<w_enrolled>women who enrolled)'
+    r'|(?P<m_enrolled>men who enrolled)'
+    r'|(?P<s_applied>students who applied)'
+    r'|(?P<s_admitted>students admitted)'
+    r'|(?P<s_enrolled>students enrolled)'
+    r'|(?P<firsttime>first-time)'
+    r'|(?P<fulltime>full-time)'
+    r'|(?P<parttime>part-time)'
+    r'|(?P<fall>fall))'
+)
+
+# Early Decision. The bare 'ED' alternative is word-bounded here: inside a
+# fused alternation an unanchored 'ED.*?' would fire on the first 'ed'
+# substring in the document instead of waiting its turn as the last resort.
+_ED_PATTERNS = {
+    'applied': (
+        r'Number of early decision applications received\s*(\d[\d,]*)',
+        r'early decision.{0,80}?applications received\s*(\d[\d,]*)',
+        r'Early Decision.{0,120}?applicants.{0,80}?(\d[\d,]*)',
+        r'\bED\b.{0,120}?applications.{0,80}?(\d[\d,]*)',
+    ),
+    'admitted': (
+        r'Number of applicants admitted under early decision plan\s*(\d[\d,]*)',
+        r'applicants admitted under early decision\s*(\d[\d,]*)',
+        r'Early Decision.{0,120}?admitted.{0,80}?(\d[\d,]*)',
+    ),
+}
+_ED_ALT = re.compile(_fuse(_ED_PATTERNS), re.IGNORECASE)
+
+# Test scores (Section C9)
+_ERW_PATTERNS = (
+    re.compile(r'SAT Evidence-Based Reading.*?(\d{3})\s*[-–]?\s*(\d{3})', re.IGNORECASE),
+    re.compile(r'SAT EBRW.*?(\d{3})\s*[-–]?\s*(\d{3})', re.IGNORECASE),
+    re.compile(r'Evidence-Based Reading and Writing.*?(\d{3})\s+(\d{3})', re.IGNORECASE),
+)
+_MATH_PATTERNS = (
+    re.compile(r'SAT Math.*?(\d{3})\s*[-–]?\s*(\d{3})', re.IGNORECASE),
+)
+_ACT_PATTERNS = (
+    re.compile(r'ACT Composite.*?(\d{2})\s*[-–]?\s*(\d{2})', re.IGNORECASE),
+    re.compile(r'ACT Composite\s+(\d{2})\s+(\d{2})', re.IGNORECASE),
+)
+
+# Enrollment (Section B1)
+_UNDERGRAD_PATTERNS = (
+    re.compile(r'Total.*?degree-seeking.*?undergraduates\s*(\d[\d,]*)', re.IGNORECASE),
+    re.compile(r'degree-seeking undergraduates.*?Total\s*(\d[\d,]*)', re.IGNORECASE),
+    re.compile(r'Total\s+undergraduate\s+enrollment\s*(\d[\d,]*)', re.IGNORECASE),
+)
+_GRAD_PATTERNS = (
+    re.compile(r'Total.*?graduate.*?enrollment\s*(\d[\d,]*)', re.IGNORECASE),
+    re.compile(r'Total.*?graduate.*?professional.*?(\d[\d,]*)', re.IGNORECASE),
+)
+_COMMA_NUM_RE = re.compile(r'\b(\d,\d{3})\b')
+
+# Race/ethnicity rows (Section B2): one alternation search per table row,
+# with the matching category read off the group name, instead of nested
+# category/keyword substring loops
+_RACE_KEYWORDS = {
+    'international': ('nonresident', 'international'),
+    'hispanicLatino': ('hispanic', 'latino'),
+    'blackAfricanAmerican': ('black', 'african american'),
+    'white': ('white',),
+    'asian': ('asian',),
+    'americanIndianAlaskaNative': ('american indian', 'alaska native'),
+    'nativeHawaiianPacificIslander': ('native hawaiian', 'pacific islander'),
+    'twoOrMoreRaces': ('two or more',),
+    'unknown': ('unknown', 'race/ethnicity unknown'),
+}
+_RACE_RE = re.compile('|'.join(
+    f'(?P<{cat}>{"|".join(re.escape(k) for k in kws)})'
+    for cat, kws in _RACE_KEYWORDS.items()
+))
+
+# Residency (Section F1)
+_OUT_PATTERNS = (
+    re.compile(r'out of state.*?(\d+(?:\.\d+)?)\s*%', re.IGNORECASE),
+    re.compile(r'out-of-state.*?(\d+(?:\.\d+)?)\s*%', re.IGNORECASE),
+    re.compile(r'outofstate.*?(\d+(?:\.\d+)?)', re.IGNORECASE),
+)
+
+# Costs (Section G), one fused scan with per-field sanity ranges
+_COST_PATTERNS = {
+    'tuition': (
+        r'Tuition:\s*\$?([\d,]+(?:\.\d{2})?)',
+        r'PRIVATE INSTITUTIONS.*?Tuition[:\s]+\$?([\d,]+)',
+        r'Tuition[:\s]+\$?([\d,]+)',
+    ),
+    'fees': (
+        r'Required Fees:\s*\$?([\d,]+(?:\.\d{2})?)',
+        r'REQUIRED FEES[:\s]*\$?([\d,]+)',
+    ),
+    'roomAndBoard': (
+        r'Food and housing \(on-campus\):\s*\$?([\d,]+(?:\.\d{2})?)',
+        r'Food and [Hh]ousing[:\s]*\$?([\d,]+)',
+        r'Room and [Bb]oard.*?\$?([\d,]+)',
+        r'ROOM AND BOARD[:\s]*\(on-campus\)\s*\$?([\d,]+)',
+    ),
+}
+_COST_RANGES = {
+    'tuition': (45000, 80000),      # Northwestern tuition ~$50K-$70K
+    'fees': (100, 5000),
+    'roomAndBoard': (13000, 25000),
+}
+_COST_ALT = re.compile(_fuse(_COST_PATTERNS), re.IGNORECASE)
+_DOLLAR_RE = re.compile(r'\$?([\d,]+)')
+
+# Financial aid (Section H)
+_GRANT_PATTERNS = (
+    re.compile(r'H2\s*k.{0,120}?\$?([\d,]+)', re.IGNORECASE),
+    re.compile(r'average need-based.{0,80}?grant.{0,80}?\$?([\d,]+)', re.IGNORECASE),
+    re.compile(r'Average.{0,80}?need-based.{0,80}?scholarship.{0,80}?grant.{0,80}?\$?([\d,]+)', re.IGNORECASE),
+)
+_AID_PATTERNS = (
+    re.compile(r'H2\s*j.{0,120}?\$?([\d,]+)', re.IGNORECASE),
+    re.compile(r'average.{0,80}?financial aid.{0,80}?package.{0,80}?\$?([\d,]+)', re.IGNORECASE),
+)
+_FULLY_MET_PATTERNS = (
+    re.compile(r'fully met.{0,80}?(\d+(?:\.\d+)?)\s*%', re.IGNORECASE),
+    re.compile(r'need fully met.{0,80}?(\d+(?:\.\d+)?)', re.IGNORECASE),
+    re.compile(r'(\d+(?:\.\d+)?)\s*%.{0,120}?fully met', re.IGNORECASE),
+)
+_RECEIVING_PATTERNS = (
+    re.compile(r'(\d+(?:\.\d+)?)\s*%.{0,120}?receiving.{0,80}?need-based', re.IGNORECASE),
+    re.compile(r'receiving.{0,80}?aid.{0,120}?(\d+(?:\.\d+)?)\s*%', re.IGNORECASE),
+    re.compile(r'H2\s*a.{0,120}?(\d+(?:\.\d+)?)\s*%', re.IGNORECASE),
+)
+
+# Fast paths for fixed-literal labels: str.find locates the literal at C
+# speed, then a tiny tail regex parses just the number after it. A miss
+# (including a case variant) falls back to the general pattern scans.
+_NUM_TAIL_RE = re.compile(r'\s*(\d[\d,]*)')
+_DOLLAR_TAIL_RE = re.compile(r'\s*\$?([\d,]+(?:\.\d{2})?)')
+_H2_TAIL_RE = re.compile(r'.{0,200}?\$?([\d,]+)')
+_ED_ANCHORS = (
+    ('applied', 'Number of early decision applications received'),
+    ('admitted', 'Number of applicants admitted under early decision plan'),
+)
+_COST_ANCHORS = (
+    ('tuition', 'Tuition:'),
+    ('fees', 'Required Fees:'),
+    ('roomAndBoard', 'Food and housing (on-campus):'),
+)
+_H2_ANCHORS = (
+    ('averageAidPackage', 'H2 j'),
+    ('averageNeedBasedGrant', 'H2 k'),
+)
+
+# Sections the extractors actually read. Once every one has been seen,
+# the remaining pages (CDS PDFs end with sections I/J that nothing here
+# consumes) are never turned.
+_NEEDED_SECTIONS = ('b1', 'b2', 'c1', 'c9', 'f1', 'g1', 'h2')
+
+# Filename years
+_YEAR_PATTERNS = (
+    re.compile(r'(\d{4})[-_](\d{4})'),
+    re.compile(r'(\d{4})[-_](\d{2})\b'),
+)
+
 
 def extract_number(text):
-    """Extract a number from text, handling commas and decimals."""
+    """Extract a number from text, handling commas and decimals.
+
+    Hand-rolled single pass: this runs for every match group and table
+    cell, where one short character scan beats the regex engine's
+    strip/strip/search dispatches. Commas and whitespace inside the digit
+    run are skipped; anything else (like the .0 decimals from newer
+    PDFs) ends the number.
+    """
     if not text:
         return None
-    cleaned = re.sub(r'[,\s]', '', str(text))
-    # Handle .0 decimals from newer PDFs
-    cleaned = re.sub(r'\.0$', '', cleaned)
-    match = re.search(r'(\d+)', cleaned)
-    return int(match.group(1)) if match else None
+    s = str(text)
+    n = len(s)
+    i = 0
+    while i < n and not '0' <= s[i] <= '9':
+        i += 1
+    if i == n:
+        return None
+    acc = 0
+    while i < n:
+        c = s[i]
+        if '0' <= c <= '9':
+            acc = acc * 10 + (ord(c) - 48)
+        elif c not in ', \t\r\n':
+            break
+        i += 1
+    return acc
+
+
+def _find_anchored(text, anchor, tail_re):
+    """Match tail_re immediately after a literal anchor, found via str.find.
+
+    Returns the tail match, or None when the anchor is absent — in which
+    case the caller falls back to its regex pattern loop.
+    """
+    pos = text.find(anchor)
+    if pos < 0:
+        return None
+    return tail_re.match(text, pos + len(anchor))
 
 
-def extract_pdf_text(pdf_path):
-    """Extract all text from PDF."""
+def extract_pdf_text_and_tables(pdf_path):
+    """Extract all text and tables from PDF in a single pass.
+
+    One pdfplumber.open and one walk over the pages gathers both, instead
+    of parsing every page twice with separate text and table helpers.
+    The walk stops early once every section we read from has been seen,
+    so the trailing I/J pages of a 30+ page CDS are never parsed.
+    """
+    text_parts = []
+    tables = []
+    seen = set()
     with pdfplumber.open(pdf_path) as pdf:
-        text_parts = []
         for page in pdf.pages:
             text = page.extract_text()
+            lower = ''
             if text:
                 text_parts.append(text)
-        return "\n".join(text_parts)
+                lower = text.lower()
+                for label in _NEEDED_SECTIONS:
+                    if label not in seen and label in lower:
+                        seen.add(label)
+            tables.extend(page.extract_tables())
+            # The H2 a-k rows can spill onto a following page, so only
+            # stop once a page no longer mentions H2 at all
+            if len(seen) == len(_NEEDED_SECTIONS) and 'h2' not in lower:
+                break
+    return "\n".join(text_parts), tables
 
 
-def extract_pdf_tables(pdf_path):
-    """Extract all tables from PDF."""
-    tables = []
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            page_tables = page.extract_tables()
-            tables.extend(page_tables)
-    return tables
+def _load_pdf_cached(pdf_file):
+    """Extract text and tables, memoized on disk when PDF_CACHE=1.
+
+    The cache key is the SHA256 of the PDF bytes, so entries stay valid
+    across renames and git checkouts and go stale only when the content
+    changes. With a warm cache, reruns while iterating on the regex
+    logic skip pdfplumber entirely and just unpickle.
+    """
+    if not os.environ.get('PDF_CACHE'):
+        return extract_pdf_text_and_tables(str(pdf_file))
+
+    sha = hashlib.sha256(pdf_file.read_bytes()).hexdigest()
+    cache_path = Path('.cache/pdftext') / f'{sha}.pkl'
+    if cache_path.exists():
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
 
+    result = extract_pdf_text_and_tables(str(pdf_file))
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, 'wb') as f:
+        pickle.dump(result, f)
+    return result
 
-def extract_admissions(text, tables):
+
+def extract_admissions(text_joined, lines, flat_rows):
     """Extract admissions data from Section C."""
     data = {
         "applied": 0,
@@ -59,47 +357,19 @@ def extract_admissions(text, tables):
         "yield": 0,
     }
 
-    text_joined = text.replace('\n', ' ')
-
     men_applied = women_applied = 0
     men_admitted = women_admitted = 0
     men_enrolled = women_enrolled = 0
 
-    # Pattern 1: Older format - gendered totals in text
-    gender_patterns = {
-        'men_applied': [
-            r'Total first-time.*?men who applied\s+(\d[\d,]*)',
-            r'first-time.*?first-year.*?men who applied\s+(\d[\d,]*)',
-        ],
-        'women_applied': [
-            r'Total first-time.*?women who applied\s+(\d[\d,]*)',
-            r'first-time.*?first-year.*?women who applied\s+(\d[\d,]*)',
-        ],
-        'men_admitted': [
-            r'Total first-time.*?men who were admitted\s+(\d[\d,]*)',
-            r'first-time.*?first-year.*?men who were admitted\s+(\d[\d,]*)',
-        ],
-        'women_admitted': [
-            r'Total first-time.*?women who were admitted\s+(\d[\d,]*)',
-            r'first-time.*?first-year.*?women who were admitted\s+(\d[\d,]*)',
-        ],
-        'men_enrolled': [
-            r'Total full-time.*?men who enrolled\s+(\d[\d,]*)',
-            r'full-time.*?first-year.*?men who enrolled\s+(\d[\d,]*)',
-        ],
-        'women_enrolled': [
-            r'Total full-time.*?women who enrolled\s+(\d[\d,]*)',
-            r'full-time.*?first-year.*?women who enrolled\s+(\d[\d,]*)',
-        ],
-    }
-
+    # Pattern 1: Older format - gendered totals, one fused pass
     values = {}
-    for key, pats in gender_patterns.items():
-        for pat in pats:
-            match = re.search(pat, text_joined, re.IGNORECASE)
-            if match:
-                values[key] = extract_number(match.group(1)) or 0
-                break
+    for m in _GENDER_ALT.finditer(text_joined):
+        key = m.lastgroup.rsplit('_', 1)[0]
+        if key in values:
+            continue
+        values[key] = extract_number(m.group(m.lastindex + 1)) or 0
+        if len(values) == 6:
+            break
 
     if 'men_applied' in values and 'women_applied' in values:
         men_applied = values['men_applied']
@@ -111,91 +381,67 @@ def extract_admissions(text, tables):
         men_enrolled = values['men_enrolled']
         women_enrolled = values['women_enrolled']
 
-    # Pattern 2: Table-based extraction
-    for table in tables:
-        if not table:
-            continue
-        for row in table:
-            if not row:
+    # Pattern 2: Table-based extraction. Skipped outright when the text
+    # pass above already resolved all six gendered values, which is the
+    # common case for older PDFs.
+    if len(values) < 6:
+        for row, row_text in flat_rows:
+            # One scan tags the row; rows without any trigger keyword (the
+            # vast majority) are skipped before any number parsing
+            tags = {m.lastgroup for m in _ROW_TRIGGER_RE.finditer(row_text)}
+            if not tags:
                 continue
-            row_text = ' '.join(str(c) for c in row if c).lower()
 
-            # Look for gendered rows in tables
-            if 'men who applied' in row_text and 'first-time' in row_text:
-                for cell in row:
-                    num = extract_number(str(cell))
-                    if num and num > 5000:
-                        if men_applied == 0:
-                            men_applied = num
-                        break
-
-            if 'women who applied' in row_text and 'first-time' in row_text:
-                for cell in row:
-                    num = extract_number(str(cell))
-                    if num and num > 5000:
-                        if women_applied == 0:
-                            women_applied = num
-                        break
-
-            if 'men who were admitted' in row_text and 'first-time' in row_text:
-                for cell in row:
-                    num = extract_number(str(cell))
-                    if num and 500 < num < 5000:
-                        if men_admitted == 0:
-                            men_admitted = num
-                        break
+            # All of the row's integers in one pass; the branches below just
+            # filter by their sanity ranges
+            row_nums = [int(n.replace(',', '')) for n in _INT_RE.findall(row_text)]
 
-            if 'women who were admitted' in row_text and 'first-time' in row_text:
-                for cell in row:
-                    num = extract_number(str(cell))
-                    if num and 500 < num < 5000:
-                        if women_admitted == 0:
-                            women_admitted = num
-                        break
-
-            if 'men who enrolled' in row_text and ('first-time' in row_text or 'full-time' in row_text):
-                for cell in row:
-                    num = extract_number(str(cell))
-                    if num and 500 < num < 2000:
-                        if men_enrolled == 0:
-                            men_enrolled = num
-                        break
-
-            if 'women who enrolled' in row_text and ('first-time' in row_text or 'full-time' in row_text):
-                for cell in row:
-                    num = extract_number(str(cell))
-                    if num and 500 < num < 2000:
-                        if women_enrolled == 0:
-                            women_enrolled = num
-                        break
+            # Look for gendered rows in tables
+            if 'm_applied' in tags and 'firsttime' in tags:
+                candidates = [n for n in row_nums if n > 5000]
+                if candidates and men_applied == 0:
+                    men_applied = candidates[0]
+
+            if 'w_applied' in tags and 'firsttime' in tags:
+                candidates = [n for n in row_nums if n > 5000]
+                if candidates and women_applied == 0:
+                    women_applied = candidates[0]
+
+            if 'm_admitted' in tags and 'firsttime' in tags:
+                candidates = [n for n in row_nums if 500 < n < 5000]
+                if candidates and men_admitted == 0:
+                    men_admitted = candidates[0]
+
+            if 'w_admitted' in tags and 'firsttime' in tags:
+                candidates = [n for n in row_nums if 500 < n < 5000]
+                if candidates and women_admitted == 0:
+                    women_admitted = candidates[0]
+
+            if 'm_enrolled' in tags and ('firsttime' in tags or 'fulltime' in tags):
+                candidates = [n for n in row_nums if 500 < n < 2000]
+                if candidates and men_enrolled == 0:
+                    men_enrolled = candidates[0]
+
+            if 'w_enrolled' in tags and ('firsttime' in tags or 'fulltime' in tags):
+                candidates = [n for n in row_nums if 500 < n < 2000]
+                if candidates and women_enrolled == 0:
+                    women_enrolled = candidates[0]
 
             # Pattern 3: Newer format - "students who applied in Fall YYYY"
-            if 'students who applied' in row_text and ('first-time' in row_text or 'fall' in row_text):
-                nums = []
-                for cell in row:
-                    num = extract_number(str(cell))
-                    if num and num > 5000:
-                        nums.append(num)
+            if 's_applied' in tags and ('firsttime' in tags or 'fall' in tags):
+                nums = [n for n in row_nums if n > 5000]
                 if len(nums) >= 2 and men_applied == 0:
                     men_applied = nums[0]
                     women_applied = nums[1]
 
-            if 'students admitted' in row_text and ('first-time' in row_text or 'fall' in row_text):
-                nums = []
-                for cell in row:
-                    num = extract_number(str(cell))
-                    if num and 300 < num < 5000:
-                        nums.append(num)
+            if 's_admitted' in tags and ('firsttime' in tags or 'fall' in tags):
+                nums = [n for n in row_nums if 300 < n < 5000]
                 if len(nums) >= 2 and men_admitted == 0:
                     men_admitted = nums[0]
                     women_admitted = nums[1]
 
-            if 'students enrolled' in row_text and 'part-time' not in row_text and ('first-time' in row_text or 'fall' in row_text):
-                nums = []
-                for cell in row:
-                    num = extract_number(str(cell))
-                    if num and 300 < num < 2000:
-                        nums.append(num)
+            if 's_enrolled' in tags and 'parttime' not in tags and ('firsttime' in tags or 'fall' in tags):
+                nums = [n for n in row_nums if 300 < n < 2000]
                 if len(nums) >= 2 and men_enrolled == 0:
                     men_enrolled = nums[0]
                     women_enrolled = nums[1]
@@ -210,12 +456,11 @@ def extract_admissions(text, tables):
 
     # Fallback: look for total lines if gendered approach failed
     if data['applied'] == 0:
-        lines = text.split('\n')
         for i, line in enumerate(lines):
             line_lower = line.lower()
             if 'total first-time' in line_lower and ('applied' in line_lower or 'applicant' in line_lower):
                 combined = ' '.join(lines[i:i+3])
-                numbers = re.findall(r'\b(\d{2},\d{3})\b', combined)
+                numbers = _FIVE_DIGIT_RE.findall(combined)
                 large_nums = [extract_number(n) for n in numbers if extract_number(n) and extract_number(n) > 20000]
                 if large_nums:
                     data['applied'] = max(large_nums)
@@ -227,59 +472,50 @@ def extract_admissions(text, tables):
     if data['admitted'] > 0 and data['enrolled'] > 0:
         data['yield'] = round(data['enrolled'] / data['admitted'], 4)
 
-    # Early Decision
+    # Early Decision. The canonical C21 labels are fixed literals, so try
+    # a str.find fast path first; the fused scan only runs on a miss.
     ed_applied = None
     ed_admitted = None
 
-    ed_patterns_applied = [
-        r'Number of early decision applications received\s*(\d[\d,]*)',
-        r'early decision.*?applications received\s*(\d[\d,]*)',
-        r'Early Decision.*?applicants.*?(\d[\d,]*)',
-        r'ED.*?applications.*?(\d[\d,]*)',
-    ]
-    ed_patterns_admitted = [
-        r'Number of applicants admitted under early decision plan\s*(\d[\d,]*)',
-        r'applicants admitted under early decision\s*(\d[\d,]*)',
-        r'Early Decision.*?admitted.*?(\d[\d,]*)',
-    ]
-
-    for pat in ed_patterns_applied:
-        match = re.search(pat, text_joined, re.IGNORECASE)
-        if match:
-            num = extract_number(match.group(1))
+    for field, anchor in _ED_ANCHORS:
+        m = _find_anchored(text_joined, anchor, _NUM_TAIL_RE)
+        if not m:
+            continue
+        num = extract_number(m.group(1))
+        if field == 'applied':
             if num and 1000 < num < 8000:
                 ed_applied = num
-                break
-
-    for pat in ed_patterns_admitted:
-        match = re.search(pat, text_joined, re.IGNORECASE)
-        if match:
-            num = extract_number(match.group(1))
-            if num and 300 < num < 3000:
+        elif num and 300 < num < 3000:
+            ed_admitted = num
+
+    if ed_applied is None or ed_admitted is None:
+        for m in _ED_ALT.finditer(text_joined):
+            field = m.lastgroup.rsplit('_', 1)[0]
+            num = extract_number(m.group(m.lastindex + 1))
+            if field == 'applied':
+                if ed_applied is None and num and 1000 < num < 8000:
+                    ed_applied = num
+            elif ed_admitted is None and num and 300 < num < 3000:
                 ed_admitted = num
+            if ed_applied is not None and ed_admitted is not None:
                 break
 
     # Also search tables for ED
     if not ed_applied:
-        for table in tables:
-            if not table:
+        for row, row_text in flat_rows:
+            if 'early decision' not in row_text:
                 continue
-            for row in table:
-                if not row:
-                    continue
-                row_text = ' '.join(str(c) for c in row if c).lower()
-                if 'early decision' in row_text and 'received' in row_text:
-                    for cell in row:
-                        num = extract_number(str(cell))
-                        if num and 1000 < num < 8000:
-                            ed_applied = num
-                            break
-                if 'admitted under early decision' in row_text:
-                    for cell in row:
-                        num = extract_number(str(cell))
-                        if num and 300 < num < 3000:
-                            ed_admitted = num
-                            break
+            row_nums = [int(n.replace(',', '')) for n in _INT_RE.findall(row_text)]
+            if 'received' in row_text:
+                candidates = [n for n in row_nums if 1000 < n < 8000]
+                if candidates:
+                    ed_applied = candidates[0]
+            if 'admitted under early decision' in row_text:
+                candidates = [n for n in row_nums if 300 < n < 3000]
+                if candidates:
+                    ed_admitted = candidates[0]
+            if ed_applied is not None and ed_admitted is not None:
+                break
 
     if ed_applied and ed_admitted:
         data['earlyDecision'] = {'applied': ed_applied, 'admitted': ed_admitted}
@@ -287,10 +523,9 @@ def extract_admissions(text, tables):
     return data
 
 
-def extract_test_scores(text):
+def extract_test_scores(text_joined):
     """Extract SAT/ACT scores from Section C9."""
     data = {}
-    text_joined = text.replace('\n', ' ')
 
     sat_data = {
         "composite": {"p25": 0, "p50": 0, "p75": 0},
@@ -300,14 +535,8 @@ def extract_test_scores(text):
     }
 
     # SAT ERW
-    erw_patterns = [
-        r'SAT Evidence-Based Reading.*?(\d{3})\s*[-–]?\s*(\d{3})',
-        r'SAT EBRW.*?(\d{3})\s*[-–]?\s*(\d{3})',
-        r'Evidence-Based Reading and Writing.*?(\d{3})\s+(\d{3})',
-    ]
-
-    for pat in erw_patterns:
-        match = re.search(pat, text_joined, re.IGNORECASE)
+    for pat in _ERW_PATTERNS:
+        match = pat.search(text_joined)
         if match:
             p25 = int(match.group(1))
             p75 = int(match.group(2))
@@ -318,12 +547,8 @@ def extract_test_scores(text):
                 break
 
     # SAT Math
-    math_patterns = [
-        r'SAT Math.*?(\d{3})\s*[-–]?\s*(\d{3})',
-    ]
-
-    for pat in math_patterns:
-        match = re.search(pat, text_joined, re.IGNORECASE)
+    for pat in _MATH_PATTERNS:
+        match = pat.search(text_joined)
         if match:
             p25 = int(match.group(1))
             p75 = int(match.group(2))
@@ -346,13 +571,8 @@ def extract_test_scores(text):
         "submissionRate": 0,
     }
 
-    act_patterns = [
-        r'ACT Composite.*?(\d{2})\s*[-–]?\s*(\d{2})',
-        r'ACT Composite\s+(\d{2})\s+(\d{2})',
-    ]
-
-    for pat in act_patterns:
-        match = re.search(pat, text_joined, re.IGNORECASE)
+    for pat in _ACT_PATTERNS:
+        match = pat.search(text_joined)
         if match:
             p25 = int(match.group(1))
             p75 = int(match.group(2))
@@ -366,7 +586,7 @@ def extract_test_scores(text):
     return data
 
 
-def extract_demographics(text, tables):
+def extract_demographics(text_joined, flat_rows):
     """Extract enrollment and demographic data from Section B."""
     data = {
         "enrollment": {"total": 0, "undergraduate": 0, "graduate": 0},
@@ -384,18 +604,9 @@ def extract_demographics(text, tables):
         "byResidency": {"inState": 0, "outOfState": 0, "international": 0},
     }
 
-    text_joined = text.replace('\n', ' ')
-    lines = text.split('\n')
-
     # Undergraduate enrollment - Northwestern has ~8000-8700 undergrads
-    undergrad_patterns = [
-        r'Total.*?degree-seeking.*?undergraduates\s*(\d[\d,]*)',
-        r'degree-seeking undergraduates.*?Total\s*(\d[\d,]*)',
-        r'Total\s+undergraduate\s+enrollment\s*(\d[\d,]*)',
-    ]
-
-    for pat in undergrad_patterns:
-        match = re.search(pat, text_joined, re.IGNORECASE)
+    for pat in _UNDERGRAD_PATTERNS:
+        match = pat.search(text_joined)
         if match:
             num = extract_number(match.group(1))
             if num and 7000 < num < 10000:
@@ -404,39 +615,28 @@ def extract_demographics(text, tables):
 
     # Also search tables
     if data["enrollment"]["undergraduate"] == 0:
-        for table in tables:
-            if not table:
-                continue
-            for row in table:
-                if not row:
-                    continue
-                row_text = ' '.join(str(c) for c in row if c).lower()
-                if ('degree-seeking' in row_text or 'undergraduate' in row_text) and 'total' in row_text:
-                    for cell in row:
-                        num = extract_number(str(cell))
-                        if num and 7000 < num < 10000:
-                            data["enrollment"]["undergraduate"] = num
-                            break
-
-    # Also try looking for B1 section numbers
-    if data["enrollment"]["undergraduate"] == 0:
-        for line in lines:
-            if 'undergraduate' in line.lower() and 'degree-seeking' in line.lower():
-                nums = re.findall(r'\b(\d,\d{3})\b', line)
-                for n in nums:
-                    num = extract_number(n)
+        for row, row_text in flat_rows:
+            if ('degree-seeking' in row_text or 'undergraduate' in row_text) and 'total' in row_text:
+                for cell in row:
+                    num = extract_number(cell)
                     if num and 7000 < num < 10000:
                         data["enrollment"]["undergraduate"] = num
                         break
 
-    # Graduate enrollment - Northwestern has ~12000-14000 grad students
-    grad_patterns = [
-        r'Total.*?graduate.*?enrollment\s*(\d[\d,]*)',
-        r'Total.*?graduate.*?professional.*?(\d[\d,]*)',
-    ]
+    # Safety net: first in-range comma number after the B1 label, one
+    # finditer over the joined text instead of a findall per line
+    if data["enrollment"]["undergraduate"] == 0:
+        pos = text_joined.find('degree-seeking')
+        if pos >= 0:
+            for m in _COMMA_NUM_RE.finditer(text_joined, pos):
+                num = extract_number(m.group(1))
+                if num and 7000 < num < 10000:
+                    data["enrollment"]["undergraduate"] = num
+                    break
 
-    for pat in grad_patterns:
-        match = re.search(pat, text_joined, re.IGNORECASE)
+    # Graduate enrollment - Northwestern has ~12000-14000 grad students
+    for pat in _GRAD_PATTERNS:
+        match = pat.search(text_joined)
         if match:
             num = extract_number(match.group(1))
             if num and 8000 < num < 16000:
@@ -446,52 +646,26 @@ def extract_demographics(text, tables):
     data["enrollment"]["total"] = data["enrollment"]["undergraduate"] + data["enrollment"]["graduate"]
 
     # Demographics from B2 section - search tables
-    race_keywords = {
-        'international': ['nonresident', 'international'],
-        'hispanicLatino': ['hispanic', 'latino'],
-        'blackAfricanAmerican': ['black', 'african american'],
-        'white': ['white'],
-        'asian': ['asian'],
-        'americanIndianAlaskaNative': ['american indian', 'alaska native'],
-        'nativeHawaiianPacificIslander': ['native hawaiian', 'pacific islander'],
-        'twoOrMoreRaces': ['two or more'],
-        'unknown': ['unknown', 'race/ethnicity unknown'],
-    }
-
-    for table in tables:
-        if not table:
+    by_race = data["byRace"]
+    for row, row_text in flat_rows:
+        m = _RACE_RE.search(row_text)
+        if not m:
             continue
-        for row in table:
-            if not row:
-                continue
-            row_text = ' '.join(str(c) for c in row if c).lower()
-
-            for category, keywords in race_keywords.items():
-                for keyword in keywords:
-                    if keyword in row_text:
-                        # Get numbers from the row
-                        nums = []
-                        for cell in row:
-                            num = extract_number(str(cell))
-                            if num and num > 0:
-                                nums.append(num)
-                        # For undergrad demographics, look for reasonable numbers
-                        reasonable = [n for n in nums if 1 <= n <= 5000]
-                        if reasonable and data["byRace"][category] == 0:
-                            # Take the number that seems like undergrad total
-                            # Usually it's the 2nd or 3rd column
-                            data["byRace"][category] = max(reasonable)
-                        break
+        category = m.lastgroup
+        if by_race[category]:
+            continue
+        # For undergrad demographics, look for reasonable numbers; the
+        # undergrad total is usually the 2nd or 3rd column, so take the max
+        reasonable = [
+            n for n in (int(x.replace(',', '')) for x in _INT_RE.findall(row_text))
+            if 1 <= n <= 5000
+        ]
+        if reasonable:
+            by_race[category] = max(reasonable)
 
     # Residency from F1 section
-    out_patterns = [
-        r'out of state.*?(\d+(?:\.\d+)?)\s*%',
-        r'out-of-state.*?(\d+(?:\.\d+)?)\s*%',
-        r'outofstate.*?(\d+(?:\.\d+)?)',
-    ]
-
-    for pat in out_patterns:
-        match = re.search(pat, text_joined, re.IGNORECASE)
+    for pat in _OUT_PATTERNS:
+        match = pat.search(text_joined)
         if match:
             out_pct = float(match.group(1))
             if out_pct > 1:
@@ -513,65 +687,38 @@ def extract_demographics(text, tables):
     return data
 
 
-def extract_costs(text):
+def extract_costs(text_joined, lines):
     """Extract cost data from Section G."""
     data = {"tuition": 0, "fees": 0, "roomAndBoard": 0, "totalCOA": 0}
 
-    text_joined = text.replace('\n', ' ')
-    lines = text.split('\n')
-
-    # Tuition - Northwestern tuition ranges from ~$50K to $70K
-    tuition_patterns = [
-        r'Tuition:\s*\$?([\d,]+(?:\.\d{2})?)',
-        r'PRIVATE INSTITUTIONS.*?Tuition[:\s]+\$?([\d,]+)',
-        r'Tuition[:\s]+\$?([\d,]+)',
-    ]
-
-    for pat in tuition_patterns:
-        match = re.search(pat, text_joined, re.IGNORECASE)
-        if match:
-            num = extract_number(match.group(1))
-            if num and 45000 < num < 80000:
-                data["tuition"] = num
-                break
-
-    # Fees
-    fees_patterns = [
-        r'Required Fees:\s*\$?([\d,]+(?:\.\d{2})?)',
-        r'REQUIRED FEES[:\s]*\$?([\d,]+)',
-        r'Required fees[:\s]*\$?([\d,]+)',
-    ]
-
-    for pat in fees_patterns:
-        match = re.search(pat, text_joined, re.IGNORECASE)
-        if match:
-            num = extract_number(match.group(1))
-            if num and 100 < num < 5000:
-                data["fees"] = num
-                break
-
-    # Room and Board
-    rb_patterns = [
-        r'Food and housing \(on-campus\):\s*\$?([\d,]+(?:\.\d{2})?)',
-        r'Food and [Hh]ousing[:\s]*\$?([\d,]+)',
-        r'Room and [Bb]oard.*?\$?([\d,]+)',
-        r'ROOM AND BOARD[:\s]*\(on-campus\)\s*\$?([\d,]+)',
-        r'ROOM AND BOARD[:\s]*\$?([\d,]+)',
-    ]
-
-    for pat in rb_patterns:
-        match = re.search(pat, text_joined, re.IGNORECASE)
-        if match:
-            num = extract_number(match.group(1))
-            if num and 13000 < num < 25000:
-                data["roomAndBoard"] = num
-                break
+    # The canonical G1 labels are fixed literals, so try a str.find fast
+    # path per field first
+    for field, anchor in _COST_ANCHORS:
+        m = _find_anchored(text_joined, anchor, _DOLLAR_TAIL_RE)
+        if not m:
+            continue
+        num = extract_number(m.group(1))
+        lo, hi = _COST_RANGES[field]
+        if num and lo < num < hi:
+            data[field] = num
+
+    # Remaining fields via one fused pass; first in-range hit per field
+    # wins
+    if not (data['tuition'] and data['fees'] and data['roomAndBoard']):
+        for m in _COST_ALT.finditer(text_joined):
+            field = m.lastgroup.rsplit('_', 1)[0]
+            if data[field]:
+                continue
+            num = extract_number(m.group(m.lastindex + 1))
+            lo, hi = _COST_RANGES[field]
+            if num and lo < num < hi:
+                data[field] = num
 
     # Fallback for multi-line room and board
     if data["roomAndBoard"] == 0:
         for i, line in enumerate(lines):
             if 'ROOM AND BOARD' in line.upper() and i + 1 < len(lines):
-                match = re.search(r'\$?([\d,]+)', lines[i + 1])
+                match = _DOLLAR_RE.search(lines[i + 1])
                 if match:
                     num = extract_number(match.group(1))
                     if num and 13000 < num < 25000:
@@ -583,7 +730,7 @@ def extract_costs(text):
     return data
 
 
-def extract_financial_aid(text, tables):
+def extract_financial_aid(text_joined, flat_rows):
     """Extract financial aid data from Section H."""
     data = {
         "percentReceivingAid": 0,
@@ -592,62 +739,49 @@ def extract_financial_aid(text, tables):
         "percentNeedFullyMet": 0,
     }
 
-    text_joined = text.replace('\n', ' ')
+    # H2 J/K rows carry literal labels, so try a str.find fast path
+    # before the general pattern loops
+    for key, anchor in _H2_ANCHORS:
+        m = _find_anchored(text_joined, anchor, _H2_TAIL_RE)
+        if not m:
+            continue
+        num = extract_number(m.group(1))
+        if num and 30000 < num < 80000:
+            data[key] = num
 
     # Average need-based grant (H2 K)
-    grant_patterns = [
-        r'H2\s*k.*?\$?([\d,]+)',
-        r'average need-based.*?grant.*?\$?([\d,]+)',
-        r'Average.*?need-based.*?scholarship.*?grant.*?\$?([\d,]+)',
-    ]
-
-    for pat in grant_patterns:
-        match = re.search(pat, text_joined, re.IGNORECASE)
-        if match:
-            num = extract_number(match.group(1))
-            if num and 30000 < num < 80000:
-                data["averageNeedBasedGrant"] = num
-                break
+    if data["averageNeedBasedGrant"] == 0:
+        for pat in _GRANT_PATTERNS:
+            match = pat.search(text_joined)
+            if match:
+                num = extract_number(match.group(1))
+                if num and 30000 < num < 80000:
+                    data["averageNeedBasedGrant"] = num
+                    break
 
     # Search tables for H2 section
     if data["averageNeedBasedGrant"] == 0:
-        for table in tables:
-            if not table:
-                continue
-            for row in table:
-                if not row:
-                    continue
-                row_text = ' '.join(str(c) for c in row if c).lower()
-                if ('average' in row_text and 'grant' in row_text and 'need' in row_text) or 'h2' in row_text:
-                    for cell in row:
-                        num = extract_number(str(cell))
-                        if num and 30000 < num < 80000:
-                            data["averageNeedBasedGrant"] = num
-                            break
+        for row, row_text in flat_rows:
+            if ('average' in row_text and 'grant' in row_text and 'need' in row_text) or 'h2' in row_text:
+                for cell in row:
+                    num = extract_number(cell)
+                    if num and 30000 < num < 80000:
+                        data["averageNeedBasedGrant"] = num
+                        break
 
     # Average aid package (H2 J)
-    aid_patterns = [
-        r'H2\s*j.*?\$?([\d,]+)',
-        r'average.*?financial aid.*?package.*?\$?([\d,]+)',
-    ]
-
-    for pat in aid_patterns:
-        match = re.search(pat, text_joined, re.IGNORECASE)
-        if match:
-            num = extract_number(match.group(1))
-            if num and 30000 < num < 80000:
-                data["averageAidPackage"] = num
-                break
+    if data["averageAidPackage"] == 0:
+        for pat in _AID_PATTERNS:
+            match = pat.search(text_joined)
+            if match:
+                num = extract_number(match.group(1))
+                if num and 30000 < num < 80000:
+                    data["averageAidPackage"] = num
+                    break
 
     # Percent need fully met
-    fully_met_patterns = [
-        r'fully met.*?(\d+(?:\.\d+)?)\s*%',
-        r'need fully met.*?(\d+(?:\.\d+)?)',
-        r'(\d+(?:\.\d+)?)\s*%.*?fully met',
-    ]
-
-    for pat in fully_met_patterns:
-        match = re.search(pat, text_joined, re.IGNORECASE)
+    for pat in _FULLY_MET_PATTERNS:
+        match = pat.search(text_joined)
         if match:
             val = float(match.group(1))
             if val > 1:
@@ -657,14 +791,8 @@ def extract_financial_aid(text, tables):
                 break
 
     # Percent receiving aid
-    receiving_patterns = [
-        r'(\d+(?:\.\d+)?)\s*%.*?receiving.*?need-based',
-        r'receiving.*?aid.*?(\d+(?:\.\d+)?)\s*%',
-        r'H2\s*a.*?(\d+(?:\.\d+)?)\s*%',
-    ]
-
-    for pat in receiving_patterns:
-        match = re.search(pat, text_joined, re.IGNORECASE)
+    for pat in _RECEIVING_PATTERNS:
+        match = pat.search(text_joined)
         if match:
             val = float(match.group(1))
             if val > 1:
@@ -678,13 +806,8 @@ def extract_financial_aid(text, tables):
 
 def extract_year_from_filename(filename):
     """Extract academic year from filename."""
-    patterns = [
-        r'(\d{4})[-_](\d{4})',
-        r'(\d{4})[-_](\d{2})\b',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, filename)
+    for pattern in _YEAR_PATTERNS:
+        match = pattern.search(filename)
         if match:
             year1 = match.group(1)
             year2 = match.group(2)
@@ -694,6 +817,68 @@ def extract_year_from_filename(filename):
     return "unknown"
 
 
+def _process_one_pdf(pdf_file):
+    """Run the full extraction pipeline for a single PDF.
+
+    Top-level so it can be dispatched to worker processes; returns
+    (year, year_data), with year_data None on failure.
+    """
+    year = extract_year_from_filename(pdf_file.name)
+    print(f"\nProcessing {pdf_file.name} ({year})...")
+
+    try:
+        text, tables = _load_pdf_cached(pdf_file)
+
+        # Preprocess once; every extractor shares these instead of
+        # re-copying the full document text
+        text_joined = text.replace('\n', ' ')
+        lines = text.split('\n')
+
+        # Flatten tables once, pairing each row with its lowered text, so
+        # the table consumers stop recomputing the same join per extractor.
+        # pdfplumber cells are str or None, so no str() per cell
+        flat_rows = [
+            (row, ' '.join(c for c in row if c).lower())
+            for table in tables if table
+            for row in table if row
+        ]
+
+        year_data = {
+            "admissions": extract_admissions(text_joined, lines, flat_rows),
+            "testScores": extract_test_scores(text_joined),
+            "demographics": extract_demographics(text_joined, flat_rows),
+            "costs": extract_costs(text_joined, lines),
+            "financialAid": extract_financial_aid(text_joined, flat_rows),
+        }
+
+        # Print summary
+        adm = year_data["admissions"]
+        rate = adm.get('acceptanceRate', 0)
+        print(f"  Applied: {adm['applied']:,}, Admitted: {adm['admitted']:,}, "
+              f"Rate: {rate:.1%}, Enrolled: {adm['enrolled']:,}")
+        if adm.get('earlyDecision'):
+            ed = adm['earlyDecision']
+            print(f"  ED: {ed['applied']:,} applied, {ed['admitted']:,} admitted")
+        if year_data["testScores"].get("sat"):
+            sat = year_data["testScores"]["sat"]["composite"]
+            print(f"  SAT: {sat['p25']}-{sat['p75']}")
+        if year_data["testScores"].get("act"):
+            act = year_data["testScores"]["act"]["composite"]
+            print(f"  ACT: {act['p25']}-{act['p75']}")
+        dem = year_data["demographics"]["enrollment"]
+        print(f"  Enrollment: {dem['undergraduate']:,} undergrad, {dem['graduate']:,} grad")
+        print(f"  COA: ${year_data['costs']['totalCOA']:,}")
+        print(f"  Avg Grant: ${year_data['financialAid']['averageNeedBasedGrant']:,}")
+
+        return year, year_data
+
+    except Exception as e:
+        print(f"  Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return year, None
+
+
 def process_northwestern():
     """Process all Northwestern PDFs."""
     pdf_dir = Path("College-Data/Northwestern")
@@ -705,52 +890,20 @@ def process_northwestern():
         "years": {},
     }
 
-    for pdf_file in pdf_files:
-        year = extract_year_from_filename(pdf_file.name)
-        print(f"\nProcessing {pdf_file.name} ({year})...")
-
-        try:
-            text = extract_pdf_text(str(pdf_file))
-            tables = extract_pdf_tables(str(pdf_file))
-
-            year_data = {
-                "admissions": extract_admissions(text, tables),
-                "testScores": extract_test_scores(text),
-                "demographics": extract_demographics(text, tables),
-                "costs": extract_costs(text),
-                "financialAid": extract_financial_aid(text, tables),
-            }
-
-            school_data["years"][year] = year_data
-
-            # Print summary
-            adm = year_data["admissions"]
-            rate = adm.get('acceptanceRate', 0)
-            print(f"  Applied: {adm['applied']:,}, Admitted: {adm['admitted']:,}, "
-                  f"Rate: {rate:.1%}, Enrolled: {adm['enrolled']:,}")
-            if adm.get('earlyDecision'):
-                ed = adm['earlyDecision']
-                print(f"  ED: {ed['applied']:,} applied, {ed['admitted']:,} admitted")
-            if year_data["testScores"].get("sat"):
-                sat = year_data["testScores"]["sat"]["composite"]
-                print(f"  SAT: {sat['p25']}-{sat['p75']}")
-            if year_data["testScores"].get("act"):
-                act = year_data["testScores"]["act"]["composite"]
-                print(f"  ACT: {act['p25']}-{act['p75']}")
-            dem = year_data["demographics"]["enrollment"]
-            print(f"  Enrollment: {dem['undergraduate']:,} undergrad, {dem['graduate']:,} grad")
-            print(f"  COA: ${year_data['costs']['totalCOA']:,}")
-            print(f"  Avg Grant: ${year_data['financialAid']['averageNeedBasedGrant']:,}")
-
-        except Exception as e:
-            print(f"  Error: {e}")
-            import traceback
-            traceback.print_exc()
+    # Each PDF is an independent, CPU-bound job (pdfplumber parsing plus
+    # regex scans), so fan the files out across one worker per core
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        for year, year_data in ex.map(_process_one_pdf, pdf_files):
+            if year_data is not None:
+                school_data["years"][year] = year_data
 
     # Write output
     output_path = Path("src/data/schools/northwestern.json")
-    with open(output_path, "w") as f:
-        json.dump(school_data, f, indent=2)
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(school_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, "w") as f:
+            json.dump(school_data, f, indent=2)
 
     print(f"\nOutput written to: {output_path}")
     return school_data